@@ -42,14 +42,58 @@ Usage Example:
 __version__ = "2.0.0"
 __author__ = "PrepMind AI Team"
 
-# Import main functions for easy access
-from .question_generator import generate_questions, generate_single_subject
-from .evaluation import evaluate, get_performance_insights, calculate_percentile
-from .pdf_utils import generate_question_pdf, generate_answer_pdf
-from .llm_service import call_llm, get_llm_service
+import importlib
+from typing import TYPE_CHECKING
+
+# Main functions live in modules that pull in the Gemini client and ReportLab.
+# They are imported on first access (PEP 562) so that short-lived CLI calls
+# such as health-check do not pay for them.
+_LAZY_ATTRS = {
+    "generate_questions": "question_generator",
+    "generate_single_subject": "question_generator",
+    "evaluate": "evaluation",
+    "get_performance_insights": "evaluation",
+    "score_submissions": "evaluation",
+    "calculate_percentile": "evaluation",
+    "calculate_percentiles": "evaluation",
+    "generate_question_pdf": "pdf_utils",
+    "generate_answer_pdf": "pdf_utils",
+    "generate_both_pdfs": "pdf_utils",
+    "call_llm": "llm_service",
+    "acall_llm": "llm_service",
+    "call_llm_batch": "llm_service",
+    "stream_llm": "llm_service",
+    "get_llm_service": "llm_service",
+}
+
+if TYPE_CHECKING:
+    from .question_generator import generate_questions, generate_single_subject
+    from .evaluation import (
+        evaluate, get_performance_insights, score_submissions,
+        calculate_percentile, calculate_percentiles
+    )
+    from .pdf_utils import generate_question_pdf, generate_answer_pdf, generate_both_pdfs
+    from .llm_service import call_llm, acall_llm, call_llm_batch, stream_llm, get_llm_service
+
+
+def __getattr__(name: str):
+    """Import main functions from their submodules on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+# Import configuration for easy access
 from .exam_config import (
     SYLLABUS, MARKING_SCHEME, DIFFICULTY_LEVELS,
-    get_subjects, get_chapters, get_marking_scheme,
+    get_subjects, get_chapters, get_chapter_set, get_marking_scheme,
     is_valid_exam, is_valid_subject, is_valid_chapter
 )
 
@@ -78,10 +122,16 @@ __all__ = [
     "generate_single_subject",
     "evaluate",
     "get_performance_insights",
+    "score_submissions",
     "calculate_percentile",
+    "calculate_percentiles",
     "generate_question_pdf",
     "generate_answer_pdf",
+    "generate_both_pdfs",
     "call_llm",
+    "acall_llm",
+    "call_llm_batch",
+    "stream_llm",
     "get_llm_service",
     
     # Configuration
@@ -90,6 +140,7 @@ __all__ = [
     "DIFFICULTY_LEVELS",
     "get_subjects",
     "get_chapters",
+    "get_chapter_set",
     "get_marking_scheme",
     "is_valid_exam",
     "is_valid_subject",
@@ -4,42 +4,142 @@ Implements in-memory caching with TTL and size limits.
 """
 
 import time
+import heapq
 import hashlib
-import json
-from typing import Any, Optional, Dict, Tuple
-from collections import OrderedDict
+import logging
+from typing import Any, Optional, Dict, List, Tuple, Hashable
 from threading import Lock
 
 from .logger import get_logger
-from .constants import CACHE_TTL, CACHE_MAX_SIZE
+from .constants import CACHE_TTL, CACHE_MAX_SIZE, CACHE_NUM_SHARDS
 
 # Initialize logger
 logger = get_logger("cache")
 
 
+def _freeze(value: Any) -> Hashable:
+    """
+    Recursively convert a value into a hashable equivalent.
+    
+    Dicts become sorted tuples of (key, value) pairs and lists/sets become
+    tuples, so structured arguments such as subject_data can be used as
+    part of a cache key.
+    
+    Args:
+        value: Value to freeze
+        
+    Returns:
+        Hashable representation of the value
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def _prompt_key(prompt: str) -> str:
+    """
+    Build a compact cache key for a prompt string.
+    
+    Args:
+        prompt: Prompt text
+        
+    Returns:
+        Key of the form "llm:<32 hex chars>"
+    """
+    return "llm:" + hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+
+def llm_cache_key(prompt: str, model: str, temperature: float) -> str:
+    """
+    Build the cache key for an LLM response.
+    
+    Args:
+        prompt: Prompt text
+        model: Model name
+        temperature: Sampling temperature
+        
+    Returns:
+        Prompt digest key scoped to the model and temperature
+    """
+    return f"{_prompt_key(prompt)}|{model}|{temperature}"
+
+
+class _CacheShard:
+    """
+    A single lock stripe of an LRUCache.
+    Each key lives in exactly one shard, so shards never share state.
+    """
+    
+    __slots__ = ("capacity", "entries", "exp_heap", "tick", "lock", "hits", "misses")
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize shard.
+        
+        Args:
+            capacity: Maximum number of items held by this shard
+        """
+        self.capacity = capacity
+        # key -> (value, insert timestamp, last access ordinal)
+        self.entries: Dict[Hashable, Tuple[Any, float, int]] = {}
+        # Min-heap of (expiration time, ordinal, key); may hold stale items
+        self.exp_heap: List[Tuple[float, int, Hashable]] = []
+        self.tick = 0
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+
 class LRUCache:
     """
     Thread-safe LRU (Least Recently Used) cache with TTL support.
+    
+    Entries are striped across independently locked shards so that
+    concurrent lookups on different keys do not contend on one mutex.
+    LRU ordering is maintained per shard and is lazy: a hit only records
+    an access ordinal, and a shard is allowed to grow to twice its
+    capacity before the least recently used entries are evicted in bulk.
     """
     
-    def __init__(self, max_size: int = CACHE_MAX_SIZE, ttl: int = CACHE_TTL):
+    __slots__ = ("max_size", "ttl", "shards", "_shard_mask")
+    
+    def __init__(
+        self,
+        max_size: int = CACHE_MAX_SIZE,
+        ttl: int = CACHE_TTL,
+        num_shards: int = CACHE_NUM_SHARDS
+    ):
         """
         Initialize cache.
         
         Args:
             max_size: Maximum number of items to cache
             ttl: Time-to-live for cache entries in seconds
+            num_shards: Number of lock stripes (must be a power of two;
+                reduced for caches smaller than this)
         """
+        if num_shards < 1 or num_shards & (num_shards - 1):
+            raise ValueError(f"num_shards must be a power of two, got {num_shards}")
+        
+        # Small caches get fewer shards (the largest power of two not above
+        # max_size), so per-shard capacities never add up to more than max_size
+        num_shards = min(num_shards, 1 << (max(1, max_size).bit_length() - 1))
+        
         self.max_size = max_size
         self.ttl = ttl
-        self.cache: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
-        self.lock = Lock()
-        self.hits = 0
-        self.misses = 0
+        self.shards = [
+            _CacheShard(max(1, max_size // num_shards))
+            for _ in range(num_shards)
+        ]
+        self._shard_mask = num_shards - 1
         
-        logger.info(f"Cache initialized: max_size={max_size}, ttl={ttl}s")
+        logger.info(f"Cache initialized: max_size={max_size}, ttl={ttl}s, shards={num_shards}")
     
-    def _generate_key(self, *args, **kwargs) -> str:
+    def _generate_key(self, *args, **kwargs) -> Hashable:
         """
         Generate cache key from arguments.
         
@@ -48,19 +148,20 @@ class LRUCache:
             **kwargs: Keyword arguments
             
         Returns:
-            Cache key string
+            Hashable cache key (tuple of frozen arguments)
         """
-        # Create a deterministic string from arguments
-        key_data = {
-            "args": args,
-            "kwargs": sorted(kwargs.items())
-        }
-        key_string = json.dumps(key_data, sort_keys=True)
-        
-        # Hash for shorter keys
-        return hashlib.md5(key_string.encode()).hexdigest()
+        # Tuples hash natively, so the key can be used by the dict directly.
+        # Callers rarely pass kwargs; skip the sort in that case (the key is
+        # identical either way)
+        if not kwargs:
+            return (_freeze(args), ())
+        return (_freeze(args), tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())))
     
-    def get(self, key: str) -> Optional[Any]:
+    def _shard_for(self, key: Hashable) -> _CacheShard:
+        """Return the shard responsible for a key."""
+        return self.shards[hash(key) & self._shard_mask]
+    
+    def get(self, key: Hashable) -> Optional[Any]:
         """
         Get value from cache.
         
@@ -70,28 +171,37 @@ class LRUCache:
         Returns:
             Cached value or None if not found/expired
         """
-        with self.lock:
-            if key not in self.cache:
-                self.misses += 1
-                logger.debug(f"Cache miss: {key}")
+        now = time.monotonic()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        shard = self._shard_for(key)
+        with shard.lock:
+            # Single probe: entries are tuples, so None always means missing
+            entry = shard.entries.get(key)
+            if entry is None:
+                shard.misses += 1
+                if debug:
+                    logger.debug("Cache miss: %s", key)
                 return None
             
-            value, timestamp = self.cache[key]
+            value, timestamp, _ = entry
             
             # Check if expired
-            if time.time() - timestamp > self.ttl:
-                del self.cache[key]
-                self.misses += 1
-                logger.debug(f"Cache expired: {key}")
+            if now - timestamp > self.ttl:
+                del shard.entries[key]
+                shard.misses += 1
+                if debug:
+                    logger.debug("Cache expired: %s", key)
                 return None
             
-            # Move to end (most recently used)
-            self.cache.move_to_end(key)
-            self.hits += 1
-            logger.debug(f"Cache hit: {key}")
+            # Record access ordinal (most recently used)
+            shard.entries[key] = (value, timestamp, shard.tick)
+            shard.tick += 1
+            shard.hits += 1
+            if debug:
+                logger.debug("Cache hit: %s", key)
             return value
     
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: Hashable, value: Any) -> None:
         """
         Set value in cache.
         
@@ -99,79 +209,124 @@ class LRUCache:
             key: Cache key
             value: Value to cache
         """
-        with self.lock:
-            # Remove oldest if at capacity
-            if len(self.cache) >= self.max_size and key not in self.cache:
-                oldest_key = next(iter(self.cache))
-                del self.cache[oldest_key]
-                logger.debug(f"Cache evicted (LRU): {oldest_key}")
+        now = time.monotonic()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        shard = self._shard_for(key)
+        with shard.lock:
+            # Bulk-evict least recently used entries once the shard has
+            # grown to twice its capacity
+            if len(shard.entries) >= 2 * shard.capacity and key not in shard.entries:
+                evicted = heapq.nsmallest(
+                    len(shard.entries) - shard.capacity,
+                    shard.entries.items(),
+                    key=lambda item: item[1][2]
+                )
+                for oldest_key, _ in evicted:
+                    del shard.entries[oldest_key]
+                if debug:
+                    logger.debug("Cache evicted (LRU): %d entries", len(evicted))
             
             # Add/update entry
-            self.cache[key] = (value, time.time())
-            self.cache.move_to_end(key)
-            logger.debug(f"Cache set: {key}")
+            shard.entries[key] = (value, now, shard.tick)
+            heapq.heappush(shard.exp_heap, (now + self.ttl, shard.tick, key))
+            shard.tick += 1
+            
+            # Drop stale heap items (renewed or evicted keys) if the heap
+            # has grown well beyond the number of live entries
+            if len(shard.exp_heap) > 4 * shard.capacity:
+                shard.exp_heap = [
+                    (timestamp + self.ttl, ordinal, k)
+                    for k, (_, timestamp, ordinal) in shard.entries.items()
+                ]
+                heapq.heapify(shard.exp_heap)
+            if debug:
+                logger.debug("Cache set: %s", key)
     
     def clear(self) -> None:
         """Clear all cache entries."""
-        with self.lock:
-            self.cache.clear()
-            self.hits = 0
-            self.misses = 0
-            logger.info("Cache cleared")
+        for shard in self.shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.exp_heap.clear()
+                shard.hits = 0
+                shard.misses = 0
+        logger.info("Cache cleared")
     
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
         
+        Counters are read without taking the shard locks: each read is
+        atomic, so polling stats never blocks cache traffic. Totals may be
+        off by in-flight requests, and a concurrent clear() (which resets
+        hits and misses to 0) can leave them mixing old and new counts.
+        
+        Because eviction is lazy, size can reach about twice max_size
+        before shards are trimmed back to capacity.
+        
         Returns:
             Dictionary with cache stats
         """
-        with self.lock:
-            total_requests = self.hits + self.misses
-            hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
-            
-            return {
-                "size": len(self.cache),
-                "max_size": self.max_size,
-                "hits": self.hits,
-                "misses": self.misses,
-                "hit_rate": round(hit_rate, 2),
-                "total_requests": total_requests
-            }
+        shards = self.shards
+        size = sum(len(shard.entries) for shard in shards)
+        hits = sum(shard.hits for shard in shards)
+        misses = sum(shard.misses for shard in shards)
+        
+        total_requests = hits + misses
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+        
+        return {
+            "size": size,
+            "max_size": self.max_size,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hit_rate, 2),
+            "total_requests": total_requests
+        }
     
     def remove_expired(self) -> int:
         """
         Remove all expired entries.
         
+        Only heap items whose expiration time has passed are visited, so a
+        sweep costs O(k log n) for k expired items rather than O(n).
+        
         Returns:
             Number of entries removed
         """
-        with self.lock:
-            current_time = time.time()
-            expired_keys = [
-                key for key, (_, timestamp) in self.cache.items()
-                if current_time - timestamp > self.ttl
-            ]
-            
-            for key in expired_keys:
-                del self.cache[key]
-            
-            if expired_keys:
-                logger.info(f"Removed {len(expired_keys)} expired cache entries")
-            
-            return len(expired_keys)
+        removed = 0
+        current_time = time.monotonic()
+        for shard in self.shards:
+            with shard.lock:
+                heap = shard.exp_heap
+                while heap and heap[0][0] < current_time:
+                    _, _, key = heapq.heappop(heap)
+                    entry = shard.entries.get(key)
+                    # Skip stale heap items for keys renewed since
+                    if entry is not None and current_time - entry[1] > self.ttl:
+                        del shard.entries[key]
+                        removed += 1
+        
+        if removed:
+            logger.info(f"Removed {removed} expired cache entries")
+        
+        return removed
 
 
 # Global cache instances
 _llm_cache: Optional[LRUCache] = None
 _question_cache: Optional[LRUCache] = None
+_init_lock = Lock()
 
 
 def get_llm_cache() -> LRUCache:
     """Get or create global LLM response cache."""
     global _llm_cache
     if _llm_cache is None:
-        _llm_cache = LRUCache(max_size=100, ttl=3600)  # 1 hour TTL
+        # Double-checked so concurrent first callers share one instance
+        with _init_lock:
+            if _llm_cache is None:
+                _llm_cache = LRUCache(max_size=100, ttl=3600)  # 1 hour TTL
     return _llm_cache
 
 
@@ -179,7 +334,10 @@ def get_question_cache() -> LRUCache:
     """Get or create global question cache."""
     global _question_cache
     if _question_cache is None:
-        _question_cache = LRUCache(max_size=500, ttl=7200)  # 2 hour TTL
+        # Double-checked so concurrent first callers share one instance
+        with _init_lock:
+            if _question_cache is None:
+                _question_cache = LRUCache(max_size=500, ttl=7200)  # 2 hour TTL
     return _question_cache
 
 
@@ -194,7 +352,7 @@ def cache_llm_response(func):
     """
     def wrapper(prompt: str, *args, **kwargs):
         cache = get_llm_cache()
-        key = cache._generate_key(prompt)
+        key = _prompt_key(prompt)
         
         # Try to get from cache
         cached_result = cache.get(key)
@@ -7,25 +7,27 @@ Usage:
     python -m ai_gen.cli generate-questions --config config.json
     python -m ai_gen.cli generate-pdf --questions questions.json --title "Test"
     python -m ai_gen.cli evaluate --questions questions.json --answers answers.json
+    python -m ai_gen.cli serve
+
+The serve command keeps one process alive and answers line-delimited JSON
+requests of the form {"id": ..., "command": ..., "data": {...}} on stdin,
+so imports and the in-process caches survive across calls.
 """
 
 import sys
-import json
-import argparse
+import types
+import binascii
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+import orjson
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ai_gen import (
-    generate_questions,
-    evaluate,
-    generate_question_pdf,
-    generate_answer_pdf
-)
 from ai_gen.logger import get_logger
 from ai_gen.exceptions import AIGenException
+from ai_gen.validators import intern_str
 from ai_gen.performance import get_monitor, get_performance_report
 
 # Initialize logger
@@ -36,20 +38,45 @@ def output_json(data: Dict[str, Any]) -> None:
     """
     Output JSON to stdout for Node.js to capture.
     
+    The payload is written compact and as bytes: Node.js parses it with
+    JSON.parse, so indentation only inflates large evaluation results.
+    Models may be included as-is: orjson serializes dataclasses natively
+    in field order, matching to_dict().
+    
     Args:
         data: Dictionary to output as JSON
     """
-    print(json.dumps(data, indent=2, ensure_ascii=False))
     sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.buffer.flush()
 
 
-def output_error(error: str, details: Dict[str, Any] = None) -> None:
+def load_json(path: Optional[str] = None) -> Any:
     """
-    Output error in JSON format.
+    Load JSON input from a file, or from stdin when no path is given.
+    
+    Args:
+        path: Optional path to a JSON file
+        
+    Returns:
+        Parsed JSON data
+    """
+    if path:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    return orjson.loads(sys.stdin.buffer.read())
+
+
+def error_payload(error: str, details: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Build an error response.
     
     Args:
         error: Error message
         details: Optional error details
+        
+    Returns:
+        Error response dictionary
     """
     error_data = {
         "success": False,
@@ -57,36 +84,42 @@ def output_error(error: str, details: Dict[str, Any] = None) -> None:
     }
     if details:
         error_data["details"] = details
+    return error_data
+
+
+def output_error(error: str, details: Dict[str, Any] = None) -> None:
+    """
+    Output error in JSON format.
     
-    output_json(error_data)
+    Args:
+        error: Error message
+        details: Optional error details
+    """
+    output_json(error_payload(error, details))
     sys.exit(0)
 
 
-def cmd_generate_questions(args) -> None:
+def handle_generate_questions(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Generate questions based on configuration.
     
     Args:
-        args: Command-line arguments
+        config: Parsed generation config
+        
+    Returns:
+        Response dictionary
     """
     try:
-        # Load configuration
-        if args.config:
-            with open(args.config, 'r') as f:
-                config = json.load(f)
-        else:
-            # Read from stdin
-            config = json.load(sys.stdin)
+        from ai_gen.question_generator import generate_questions
         
         logger.info(f"Generating questions with config: {config}")
         
         # Extract parameters
-        exam = config.get("exam")
+        exam = intern_str(config.get("exam"))
         subject_data = config.get("subject_data", {})
         
         if not exam or not subject_data:
-            output_error("Missing required fields: exam and subject_data")
-            return
+            return error_payload("Missing required fields: exam and subject_data")
         
         # Generate questions
         questions, by_subject = generate_questions(exam, subject_data)
@@ -95,8 +128,7 @@ def cmd_generate_questions(args) -> None:
         monitor = get_monitor()
         stats = monitor.get_stats()
         
-        # Output result
-        output_json({
+        return {
             "success": True,
             "questions": questions,
             "by_subject": by_subject,
@@ -105,30 +137,28 @@ def cmd_generate_questions(args) -> None:
                 "subjects": list(by_subject.keys()),
                 "performance": stats
             }
-        })
+        }
         
     except AIGenException as e:
         logger.error(f"AI generation error: {str(e)}")
-        output_error(str(e), {"type": type(e).__name__})
+        return error_payload(str(e), {"type": type(e).__name__})
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-        output_error(f"Unexpected error: {str(e)}")
+        return error_payload(f"Unexpected error: {str(e)}")
 
 
-def cmd_generate_pdf(args) -> None:
+def handle_generate_pdf(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Generate PDF from questions.
     
     Args:
-        args: Command-line arguments
+        data: Parsed PDF request
+        
+    Returns:
+        Response dictionary
     """
     try:
-        # Load questions
-        if args.questions:
-            with open(args.questions, 'r') as f:
-                data = json.load(f)
-        else:
-            data = json.load(sys.stdin)
+        from ai_gen.pdf_utils import generate_question_pdf, generate_answer_pdf
         
         questions_by_subject = data.get("questions_by_subject", {})
         title = data.get("title", "Mock Test")
@@ -142,40 +172,38 @@ def cmd_generate_pdf(args) -> None:
         else:
             pdf_buffer = generate_question_pdf(questions_by_subject, title)
         
-        # Output PDF as base64
-        import base64
-        pdf_base64 = base64.b64encode(pdf_buffer.read()).decode('utf-8')
+        # Output PDF as base64, encoding straight from the buffer's memory
+        with pdf_buffer.getbuffer() as pdf_view:
+            pdf_base64 = binascii.b2a_base64(pdf_view, newline=False).decode('ascii')
         
-        output_json({
+        return {
             "success": True,
             "pdf": pdf_base64,
             "title": title,
             "with_solutions": with_solutions
-        })
+        }
         
     except Exception as e:
         logger.error(f"PDF generation error: {str(e)}", exc_info=True)
-        output_error(f"PDF generation failed: {str(e)}")
+        return error_payload(f"PDF generation failed: {str(e)}")
 
 
-def cmd_evaluate(args) -> None:
+def handle_evaluate(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Evaluate test answers.
     
     Args:
-        args: Command-line arguments
+        data: Parsed evaluation request
+        
+    Returns:
+        Response dictionary
     """
     try:
-        # Load data
-        if args.data:
-            with open(args.data, 'r') as f:
-                data = json.load(f)
-        else:
-            data = json.load(sys.stdin)
+        from ai_gen.evaluation import evaluate
         
         questions = data.get("questions", [])
         user_answers = data.get("user_answers", {})
-        exam = data.get("exam", "JEE")
+        exam = intern_str(data.get("exam", "JEE"))
         
         # Convert string keys to integers for user_answers
         user_answers = {int(k): v for k, v in user_answers.items()}
@@ -185,43 +213,226 @@ def cmd_evaluate(args) -> None:
         # Evaluate
         result = evaluate(questions, user_answers, exam)
         
-        output_json({
+        return {
             "success": True,
             "result": result
-        })
+        }
         
     except Exception as e:
         logger.error(f"Evaluation error: {str(e)}", exc_info=True)
-        output_error(f"Evaluation failed: {str(e)}")
+        return error_payload(f"Evaluation failed: {str(e)}")
 
 
-def cmd_health_check(args) -> None:
+def handle_health_check(data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Health check to verify module is working.
     
     Args:
-        args: Command-line arguments
+        data: Unused request body
+        
+    Returns:
+        Response dictionary
     """
     try:
         from ai_gen.constants import DEFAULT_MODEL
         from ai_gen.cache import get_cache_stats
         
-        cache_stats = get_cache_stats()
-        
-        output_json({
+        result = {
             "success": True,
             "status": "healthy",
             "model": DEFAULT_MODEL,
-            "cache_stats": cache_stats,
+            "cache_stats": get_cache_stats(),
             "version": "2.0.0"
-        })
+        }
+        
+        # Report the circuit breaker only if this process already has a
+        # service; a health check should not import the SDK or connect
+        llm_service = sys.modules.get("ai_gen.llm_service")
+        service = llm_service._llm_service if llm_service else None
+        if service is not None:
+            result["llm"] = service.health()
+        
+        # Likewise, only report the PDF wrap cache once PDFs have been built
+        pdf_utils = sys.modules.get("ai_gen.pdf_utils")
+        if pdf_utils is not None:
+            result["cache_stats"]["pdf_wrap_cache"] = pdf_utils.get_wrap_cache_stats()
+        
+        return result
         
     except Exception as e:
-        output_error(f"Health check failed: {str(e)}")
+        return error_payload(f"Health check failed: {str(e)}")
 
 
-def main():
-    """Main CLI entry point."""
+# Request handlers keyed by command name, shared by one-shot and serve mode
+HANDLERS = {
+    "generate-questions": handle_generate_questions,
+    "generate-pdf": handle_generate_pdf,
+    "evaluate": handle_evaluate,
+    "health-check": handle_health_check
+}
+
+
+def run_command(command: str, path: Optional[str] = None) -> None:
+    """
+    Run a single command, reading its input from a file or stdin.
+    
+    Args:
+        command: Command name
+        path: Optional path to the JSON input file
+    """
+    handler = HANDLERS[command]
+    if command == "health-check":
+        output_json(handler())
+        return
+    
+    try:
+        data = load_json(path)
+    except Exception as e:
+        logger.error(f"Failed to read input for {command}: {str(e)}")
+        output_error(f"Invalid JSON input: {str(e)}")
+        return
+    
+    output_json(handler(data))
+
+
+def cmd_generate_questions(args) -> None:
+    """
+    Generate questions based on configuration.
+    
+    Args:
+        args: Command-line arguments
+    """
+    run_command("generate-questions", args.config)
+
+
+def cmd_generate_pdf(args) -> None:
+    """
+    Generate PDF from questions.
+    
+    Args:
+        args: Command-line arguments
+    """
+    run_command("generate-pdf", args.questions)
+
+
+def cmd_evaluate(args) -> None:
+    """
+    Evaluate test answers.
+    
+    Args:
+        args: Command-line arguments
+    """
+    run_command("evaluate", args.data)
+
+
+def cmd_health_check(args) -> None:
+    """
+    Health check to verify module is working.
+    
+    Args:
+        args: Command-line arguments
+    """
+    run_command("health-check")
+
+
+def handle_request(line: bytes) -> Dict[str, Any]:
+    """
+    Dispatch one line-delimited request in serve mode.
+    
+    Args:
+        line: Raw JSON request line
+        
+    Returns:
+        Response dictionary, echoing the request id
+    """
+    try:
+        request = orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        return error_payload(f"Invalid JSON request: {str(e)}")
+    
+    if not isinstance(request, dict):
+        return error_payload("Request must be a JSON object")
+    
+    command = request.get("command")
+    # Checked before the lookup: an unhashable command would raise TypeError
+    handler = HANDLERS.get(command) if isinstance(command, str) else None
+    if handler is None:
+        response = error_payload(f"Unknown command: {command}")
+    else:
+        data = request.get("data") or {}
+        try:
+            response = handler(data)
+        except Exception as e:
+            logger.error(f"Unhandled error in {command}: {str(e)}", exc_info=True)
+            response = error_payload(f"Unexpected error: {str(e)}")
+    
+    if "id" in request:
+        response["id"] = request["id"]
+    return response
+
+
+def encode_response(response: Dict[str, Any]) -> bytes:
+    """
+    Serialize a serve-mode response as one JSON line.
+    
+    A response that cannot be serialized is replaced by an error response
+    with the same id, so a bad handler result does not stop the worker.
+    
+    Args:
+        response: Response dictionary from handle_request
+        
+    Returns:
+        JSON bytes ending in a newline
+    """
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    try:
+        return orjson.dumps(response, option=option)
+    except orjson.JSONEncodeError as e:
+        logger.error(f"Response is not JSON serializable: {str(e)}")
+        fallback = error_payload(f"Response is not JSON serializable: {str(e)}")
+        if "id" in response:
+            fallback["id"] = response["id"]
+        return orjson.dumps(fallback, option=option)
+
+
+def cmd_serve(args) -> None:
+    """
+    Serve line-delimited JSON requests from stdin until EOF.
+    
+    Args:
+        args: Command-line arguments
+    """
+    logger.info("Worker started, waiting for requests")
+    
+    stdout = sys.stdout.buffer
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        stdout.write(encode_response(handle_request(line)))
+        stdout.flush()
+    
+    logger.info("Worker stdin closed, exiting")
+
+
+# Input-file option accepted by each command (None if it takes no input)
+COMMAND_OPTIONS: Dict[str, Optional[str]] = {
+    "generate-questions": "--config",
+    "generate-pdf": "--questions",
+    "evaluate": "--data",
+    "health-check": None,
+    "serve": None
+}
+
+
+def build_parser():
+    """
+    Build the argparse parser used for --help and usage errors.
+    
+    Returns:
+        Configured ArgumentParser
+    """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="AI Generation Module CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -265,25 +476,69 @@ def main():
         help="Check if module is working"
     )
     
-    args = parser.parse_args()
+    # Persistent worker command
+    subparsers.add_parser(
+        "serve",
+        help="Answer line-delimited JSON requests on stdin"
+    )
+    
+    return parser
+
+
+def parse_argv(argv: list) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Parse the fixed command surface without argparse.
+    
+    Args:
+        argv: Arguments after the program name
+        
+    Returns:
+        Tuple of (command, input_path), or None if argparse should handle
+        the arguments (help requested, unknown command or bad usage)
+    """
+    if not argv or argv[0] not in COMMAND_OPTIONS:
+        return None
+    
+    command, rest = argv[0], argv[1:]
+    option = COMMAND_OPTIONS[command]
     
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
+    if not rest:
+        return command, None
+    if option is None:
+        return None
+    if len(rest) == 2 and rest[0] == option:
+        return command, rest[1]
+    if len(rest) == 1 and rest[0].startswith(option + "="):
+        return command, rest[0][len(option) + 1:]
+    return None
+
+
+def main():
+    """Main CLI entry point."""
+    parsed = parse_argv(sys.argv[1:])
+    
+    if parsed is None:
+        # Slow path: let argparse print help or usage errors
+        parser = build_parser()
+        args = parser.parse_args()
+        if not args.command:
+            parser.print_help()
+            sys.exit(1)
+        option = COMMAND_OPTIONS[args.command]
+        parsed = (args.command, getattr(args, option[2:], None) if option else None)
+    
+    command, path = parsed
+    args = types.SimpleNamespace(command=command, config=path, questions=path, data=path)
     
     # Route to appropriate command
     commands = {
         "generate-questions": cmd_generate_questions,
         "generate-pdf": cmd_generate_pdf,
         "evaluate": cmd_evaluate,
-        "health-check": cmd_health_check
+        "health-check": cmd_health_check,
+        "serve": cmd_serve
     }
-    
-    command_func = commands.get(args.command)
-    if command_func:
-        command_func(args)
-    else:
-        output_error(f"Unknown command: {args.command}")
+    commands[command](args)
 
 
 if __name__ == "__main__":
@@ -3,14 +3,16 @@ Constants used throughout the AI generation module.
 Centralizes magic numbers and strings for easier maintenance.
 """
 
-from typing import Final
+import re
+import sys
+from typing import Dict, Final
 
 # ============================================
 # LLM Configuration
 # ============================================
 
 # Model settings
-DEFAULT_MODEL: Final[str] = "gemini-2.5-flash"  # Reverted to gemini-2.5-flash per user request
+DEFAULT_MODEL: Final[str] = sys.intern("gemini-2.5-flash")  # Reverted to gemini-2.5-flash per user request
 DEFAULT_TEMPERATURE: Final[float] = 0.4
 MAX_TOKENS: Final[int] = 8192
 TOP_P: Final[float] = 0.95
@@ -22,6 +24,19 @@ DEFAULT_LOCATION: Final[str] = "us-central1"
 MAX_RETRIES: Final[int] = 10
 RETRY_DELAY: Final[float] = 1.0  # seconds
 RETRY_BACKOFF_FACTOR: Final[float] = 2.0  # exponential backoff multiplier
+MAX_RETRY_DELAY: Final[float] = 30.0  # cap on a single backoff sleep (seconds)
+RETRY_JITTER: Final[float] = 0.5  # up to +50% random spread on each backoff
+
+# Circuit breaker: fail fast after this many consecutive failed calls
+CIRCUIT_BREAKER_THRESHOLD: Final[int] = 5
+CIRCUIT_BREAKER_COOLDOWN: Final[float] = 30.0  # seconds before probing again
+
+# Shared worker pool for parallel generation (per-call limits are applied on top)
+PARALLEL_POOL_SIZE: Final[int] = 16
+
+# HTTP connection pool (shared by all calls of one LLM service)
+HTTP_MAX_CONNECTIONS: Final[int] = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 32
 
 # Rate limiting
 MAX_REQUESTS_PER_MINUTE: Final[int] = 60
@@ -36,22 +51,28 @@ MIN_QUESTIONS_PER_SUBJECT: Final[int] = 1
 MAX_QUESTIONS_PER_SUBJECT: Final[int] = 100
 DEFAULT_QUESTIONS_PER_SUBJECT: Final[int] = 30
 
-# Difficulty levels
-DIFFICULTY_EASY: Final[str] = "Easy"
-DIFFICULTY_MEDIUM: Final[str] = "Medium"
-DIFFICULTY_HARD: Final[str] = "Hard"
+# Difficulty levels (interned, like the exam and option names below, so
+# comparisons against interned request values are pointer checks)
+DIFFICULTY_EASY: Final[str] = sys.intern("Easy")
+DIFFICULTY_MEDIUM: Final[str] = sys.intern("Medium")
+DIFFICULTY_HARD: Final[str] = sys.intern("Hard")
 VALID_DIFFICULTIES: Final[tuple] = (DIFFICULTY_EASY, DIFFICULTY_MEDIUM, DIFFICULTY_HARD)
+VALID_DIFFICULTIES_SET: Final[frozenset] = frozenset(VALID_DIFFICULTIES)
+VALID_DIFFICULTIES_STR: Final[str] = ", ".join(VALID_DIFFICULTIES)  # for error messages
 
 # Exam types
-EXAM_JEE: Final[str] = "JEE"
-EXAM_NEET: Final[str] = "NEET"
-EXAM_UPSC: Final[str] = "UPSC"
-EXAM_CSAT: Final[str] = "CSAT"
+EXAM_JEE: Final[str] = sys.intern("JEE")
+EXAM_NEET: Final[str] = sys.intern("NEET")
+EXAM_UPSC: Final[str] = sys.intern("UPSC")
+EXAM_CSAT: Final[str] = sys.intern("CSAT")
 VALID_EXAMS: Final[tuple] = (EXAM_JEE, EXAM_NEET, EXAM_UPSC, EXAM_CSAT)
+VALID_EXAMS_SET: Final[frozenset] = frozenset(VALID_EXAMS)
+VALID_EXAMS_STR: Final[str] = ", ".join(VALID_EXAMS)  # for error messages
 
 # Question structure
 NUM_OPTIONS: Final[int] = 4
-VALID_OPTIONS: Final[tuple] = ("A", "B", "C", "D")
+VALID_OPTIONS: Final[tuple] = tuple(sys.intern(opt) for opt in ("A", "B", "C", "D"))
+VALID_OPTIONS_SET: Final[frozenset] = frozenset(VALID_OPTIONS)
 
 # ============================================
 # Parsing
@@ -64,6 +85,16 @@ NUMERICAL_ANSWER_PATTERN: Final[str] = r'Answer:\s*(\-?\d+)'  # Support negative
 SOLUTION_PATTERN: Final[str] = r'Solution:\s*(.*)'
 OPTION_PATTERN: Final[str] = r'{opt}\)\s*(.*)'
 
+# Precompiled forms of the patterns above, with the flags the parser uses
+QUESTION_RE: Final[re.Pattern] = re.compile(QUESTION_PATTERN)
+ANSWER_RE: Final[re.Pattern] = re.compile(ANSWER_PATTERN, re.IGNORECASE)
+NUMERICAL_ANSWER_RE: Final[re.Pattern] = re.compile(NUMERICAL_ANSWER_PATTERN, re.IGNORECASE)
+SOLUTION_RE: Final[re.Pattern] = re.compile(SOLUTION_PATTERN, re.IGNORECASE | re.DOTALL)
+OPTION_RES: Final[Dict[str, re.Pattern]] = {
+    opt: re.compile(OPTION_PATTERN.format(opt=opt), re.IGNORECASE)
+    for opt in VALID_OPTIONS
+}
+
 # Parsing thresholds
 MIN_QUESTION_LENGTH: Final[int] = 10  # characters
 MAX_QUESTION_LENGTH: Final[int] = 1000  # characters
@@ -104,10 +135,13 @@ PDF_PARAGRAPH_SPACING: Final[int] = 10
 PDF_SECTION_SPACING: Final[int] = 25
 PDF_QUESTION_SPACING: Final[int] = 15
 PDF_OPTION_SPACING: Final[int] = 15
+PDF_HEADING_MIN_SPACE: Final[int] = 100  # room kept below a subject heading
 
 # Text wrapping
 PDF_MAX_LINE_WIDTH: Final[int] = 515  # page width - margins
 PDF_CHARS_PER_LINE: Final[int] = 80
+PDF_WRAP_CACHE_SIZE: Final[int] = 4096  # memoized line-wrap results
+PDF_LATEX_CACHE_SIZE: Final[int] = 4096  # memoized LaTeX cleanup results
 
 # ============================================
 # Evaluation
@@ -135,6 +169,8 @@ REQUIRED_OPTION_KEYS: Final[tuple] = ("A", "B", "C", "D")
 
 CACHE_TTL: Final[int] = 3600  # 1 hour in seconds
 CACHE_MAX_SIZE: Final[int] = 1000  # max cached items
+CACHE_NUM_SHARDS: Final[int] = 16  # lock stripes per cache (power of two)
+LLM_CACHE_MAX_TEMPERATURE: Final[float] = 0.7  # above this, responses are not cached
 
 # ============================================
 # Logging
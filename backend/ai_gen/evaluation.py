@@ -3,18 +3,40 @@ Evaluation module for scoring test attempts and generating analytics.
 Provides comprehensive evaluation with subject-wise breakdown and insights.
 """
 
+from bisect import bisect_left
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
-from collections import defaultdict
+from collections import Counter
 
 from .logger import get_logger
-from .models import EvaluationResult, SubjectResult, MarkingScheme
+from .models import MarkingScheme
 from .exam_config import get_marking_scheme
-from .validators import validate_user_answer
+from .constants import VALID_OPTIONS_SET
 from .exceptions import ValidationError
+from .validators import intern_str
 
 # Initialize logger
 logger = get_logger("evaluation")
 
+# Per-question outcome codes (index into the marking scheme tuple)
+_CORRECT = 0
+_WRONG = 1
+_UNATTEMPTED = 2
+
+
+@lru_cache(maxsize=8)
+def _get_scheme(exam: str) -> MarkingScheme:
+    """
+    Get the marking scheme for an exam, built once per exam.
+    
+    Args:
+        exam: Exam type
+        
+    Returns:
+        MarkingScheme instance (shared; do not mutate)
+    """
+    return MarkingScheme(**get_marking_scheme(exam))
+
 
 def evaluate(
     questions: List[Dict[str, Any]],
@@ -42,136 +64,203 @@ def evaluate(
         raise ValidationError("Questions list cannot be empty", field="questions")
     
     # Get marking scheme
-    scheme_dict = get_marking_scheme(exam)
-    scheme = MarkingScheme(**scheme_dict)
-    
-    # Initialize counters
-    total_marks = 0.0
-    positive_marks = 0.0
-    negative_marks = 0.0
-    
-    correct_count = 0
-    wrong_count = 0
-    unattempted_count = 0
-    
-    # Subject-wise tracking
-    subject_stats = defaultdict(lambda: {
-        "total": 0,
-        "attempted": 0,
-        "correct": 0,
-        "wrong": 0,
-        "unattempted": 0,
-        "marks": 0.0,
-        "max_marks": 0.0
-    })
+    scheme = _get_scheme(exam)
+    correct_marks = scheme.correct
+    wrong_marks = scheme.wrong
+    unattempted_marks = scheme.unattempted
     
-    # Detailed question results
-    question_details = []
+    # Marks awarded for each outcome code
+    marks_by_outcome = (correct_marks, wrong_marks, unattempted_marks)
     
-    # Evaluate each question
+    # Resolve every question's answer and outcome in a single pass
+    answers = []
+    outcomes = []
     for question in questions:
         q_id = question["id"]
-        subject = question.get("subject", "Unknown")
-        correct_answer = question["correct"]
         user_answer = user_answers.get(q_id)
         
-        # Validate user answer
-        if not validate_user_answer(user_answer):
+        # Validate user answer (inlined validate_user_answer)
+        if user_answer is not None and (
+            not isinstance(user_answer, str) or user_answer not in VALID_OPTIONS_SET
+        ):
             logger.warning(f"Invalid user answer for Q{q_id}: {user_answer}")
             user_answer = None
         
-        # Calculate marks
-        if user_answer == correct_answer:
-            marks = scheme.correct
-            positive_marks += marks
-            correct_count += 1
-            subject_stats[subject]["correct"] += 1
-            subject_stats[subject]["attempted"] += 1
-            is_correct = True
+        if user_answer == question["correct"]:
+            outcomes.append(_CORRECT)
         elif user_answer is None:
-            marks = scheme.unattempted
-            unattempted_count += 1
-            subject_stats[subject]["unattempted"] += 1
-            is_correct = False
+            outcomes.append(_UNATTEMPTED)
         else:
-            marks = scheme.wrong
-            negative_marks += abs(marks)
-            wrong_count += 1
-            subject_stats[subject]["wrong"] += 1
-            subject_stats[subject]["attempted"] += 1
-            is_correct = False
-        
-        total_marks += marks
-        subject_stats[subject]["marks"] += marks
-        subject_stats[subject]["max_marks"] += scheme.correct
-        subject_stats[subject]["total"] += 1
-        
-        # Store question details
-        question_details.append({
-            "id": q_id,
+            outcomes.append(_WRONG)
+        answers.append(user_answer)
+    
+    # Overall totals straight from the outcome counts
+    correct_count = outcomes.count(_CORRECT)
+    wrong_count = outcomes.count(_WRONG)
+    unattempted_count = len(outcomes) - correct_count - wrong_count
+    
+    positive_marks = float(correct_count * correct_marks)
+    negative_marks = float(wrong_count * abs(wrong_marks))
+    total_marks = float(
+        correct_count * correct_marks
+        + wrong_count * wrong_marks
+        + unattempted_count * unattempted_marks
+    )
+    
+    # Subject-wise tracking: one C-level counting pass over
+    # (subject, outcome) pairs, with subjects kept in first-seen order
+    subjects = [intern_str(question.get("subject", "Unknown")) for question in questions]
+    pair_counts = Counter(zip(subjects, outcomes))
+    
+    # Detailed question results
+    question_details = [
+        {
+            "id": question["id"],
             "subject": subject,
             "question": question.get("question", ""),
             "your_answer": user_answer,
-            "correct_answer": correct_answer,
-            "is_correct": is_correct,
-            "marks_obtained": marks,
+            "correct_answer": question["correct"],
+            "is_correct": outcome == _CORRECT,
+            "marks_obtained": marks_by_outcome[outcome],
             "solution": question.get("solution", "")
-        })
+        }
+        for question, subject, user_answer, outcome in zip(questions, subjects, answers, outcomes)
+    ]
     
     # Calculate overall accuracy
     attempted = correct_count + wrong_count
-    accuracy = (correct_count / attempted * 100) if attempted > 0 else 0.0
+    # correct_count is 0 whenever attempted is, so dividing by 1 yields 0.0
+    accuracy = correct_count / (attempted or 1) * 100
     
-    # Create subject results
+    # Create subject results (same shape as SubjectResult.to_dict(); built
+    # directly since every field was just computed)
     subject_results = []
-    for subject, stats in subject_stats.items():
-        subject_accuracy = (
-            (stats["correct"] / stats["attempted"] * 100)
-            if stats["attempted"] > 0 else 0.0
-        )
+    for subject in dict.fromkeys(subjects):
+        subject_correct = pair_counts[(subject, _CORRECT)]
+        subject_wrong = pair_counts[(subject, _WRONG)]
+        subject_unattempted = pair_counts[(subject, _UNATTEMPTED)]
+        subject_total = subject_correct + subject_wrong + subject_unattempted
+        subject_attempted = subject_correct + subject_wrong
         
-        subject_result = SubjectResult(
-            subject=subject,
-            total_questions=stats["total"],
-            attempted=stats["attempted"],
-            correct=stats["correct"],
-            wrong=stats["wrong"],
-            unattempted=stats["unattempted"],
-            marks_obtained=stats["marks"],
-            max_marks=stats["max_marks"]
-        )
-        subject_results.append(subject_result)
-    
-    # Create evaluation result
-    result = EvaluationResult(
-        total_marks=total_marks,
-        positive_marks=positive_marks,
-        negative_marks=negative_marks,
-        total_questions=len(questions),
-        attempted=attempted,
-        correct=correct_count,
-        wrong=wrong_count,
-        unattempted=unattempted_count,
-        accuracy=accuracy,
-        subject_results=subject_results,
-        question_details=question_details
-    )
+        subject_results.append({
+            "subject": subject,
+            "total_questions": subject_total,
+            "attempted": subject_attempted,
+            "correct": subject_correct,
+            "wrong": subject_wrong,
+            "unattempted": subject_unattempted,
+            "marks_obtained": float(
+                subject_correct * correct_marks
+                + subject_wrong * wrong_marks
+                + subject_unattempted * unattempted_marks
+            ),
+            "max_marks": float(subject_total * correct_marks),
+            "accuracy": subject_correct / (subject_attempted or 1) * 100
+        })
+    
+    # Create evaluation result (same shape as EvaluationResult.to_dict())
+    result = {
+        "total_marks": total_marks,
+        "positive_marks": positive_marks,
+        "negative_marks": negative_marks,
+        "total_questions": len(questions),
+        "attempted": attempted,
+        "correct": correct_count,
+        "wrong": wrong_count,
+        "unattempted": unattempted_count,
+        "accuracy": accuracy,
+        "subject_results": subject_results,
+        "question_details": question_details,
+        "time_taken": None,
+        "percentile": None
+    }
     
     logger.info(
         f"Evaluation complete: {total_marks:.1f} marks, "
         f"{correct_count}/{len(questions)} correct ({accuracy:.1f}% accuracy)"
     )
     
-    return result.to_dict()
+    return result
 
 
-def calculate_percentile(score: float, all_scores: List[float]) -> float:
+def score_submissions(
+    questions: List[Dict[str, Any]],
+    submissions: List[Dict[int, Optional[str]]],
+    exam: str
+) -> List[Dict[str, Any]]:
+    """
+    Score many attempts at the same test, e.g. when re-grading in bulk.
+    
+    Only the headline numbers are computed: the question columns and
+    marking scheme are resolved once for the whole batch, and no per-question
+    details or subject breakdowns are built.
+    
+    Args:
+        questions: List of question dictionaries
+        submissions: One answers dictionary (question ID -> answer) per attempt
+        exam: Exam type for marking scheme
+        
+    Returns:
+        List of score dictionaries, in the same order as submissions
+        
+    Raises:
+        ValidationError: If inputs are invalid
+    """
+    if not questions:
+        raise ValidationError("Questions list cannot be empty", field="questions")
+    
+    scheme = _get_scheme(exam)
+    correct_marks = scheme.correct
+    wrong_marks = scheme.wrong
+    unattempted_marks = scheme.unattempted
+    
+    answer_key = [(question["id"], question["correct"]) for question in questions]
+    total_questions = len(answer_key)
+    
+    scores = []
+    for user_answers in submissions:
+        correct_count = 0
+        wrong_count = 0
+        for q_id, correct_answer in answer_key:
+            user_answer = user_answers.get(q_id)
+            if not isinstance(user_answer, str) or user_answer not in VALID_OPTIONS_SET:
+                continue
+            if user_answer == correct_answer:
+                correct_count += 1
+            else:
+                wrong_count += 1
+        
+        unattempted_count = total_questions - correct_count - wrong_count
+        attempted = correct_count + wrong_count
+        scores.append({
+            "total_marks": float(
+                correct_count * correct_marks
+                + wrong_count * wrong_marks
+                + unattempted_count * unattempted_marks
+            ),
+            "attempted": attempted,
+            "correct": correct_count,
+            "wrong": wrong_count,
+            "unattempted": unattempted_count,
+            "accuracy": correct_count / (attempted or 1) * 100
+        })
+    
+    return scores
+
+
+def calculate_percentile(
+    score: float,
+    all_scores: List[float],
+    presorted: bool = False
+) -> float:
     """
     Calculate percentile for a given score.
     
     Args:
         score: User's score
         all_scores: List of all scores to compare against
+        presorted: Whether all_scores is already sorted ascending, which
+            allows an O(log n) bisect instead of a linear scan
         
     Returns:
         Percentile (0-100)
@@ -179,12 +268,37 @@ def calculate_percentile(score: float, all_scores: List[float]) -> float:
     if not all_scores:
         return 0.0
     
-    scores_below = sum(1 for s in all_scores if s < score)
+    if presorted:
+        scores_below = bisect_left(all_scores, score)
+    else:
+        scores_below = sum(1 for s in all_scores if s < score)
     percentile = (scores_below / len(all_scores)) * 100
     
     return round(percentile, 2)
 
 
+def calculate_percentiles(scores: List[float], all_scores: List[float]) -> List[float]:
+    """
+    Calculate percentiles for many scores against the same score pool.
+    
+    The pool is sorted once and each score is located by bisection, so
+    ranking k scores costs O((n + k) log n) rather than O(k * n).
+    
+    Args:
+        scores: Scores to rank
+        all_scores: List of all scores to compare against
+        
+    Returns:
+        Percentiles (0-100), in the same order as scores
+    """
+    if not all_scores:
+        return [0.0] * len(scores)
+    
+    sorted_scores = sorted(all_scores)
+    total = len(sorted_scores)
+    return [round(bisect_left(sorted_scores, score) / total * 100, 2) for score in scores]
+
+
 def get_performance_insights(
     result: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -197,20 +311,23 @@ def get_performance_insights(
     Returns:
         Dictionary containing insights and recommendations
     """
+    strengths = []
+    weaknesses = []
+    recommendations = []
     insights = {
-        "strengths": [],
-        "weaknesses": [],
-        "recommendations": []
+        "strengths": strengths,
+        "weaknesses": weaknesses,
+        "recommendations": recommendations
     }
     
     # Analyze overall performance
     accuracy = result["accuracy"]
     if accuracy >= 80:
-        insights["strengths"].append("Excellent overall accuracy")
+        strengths.append("Excellent overall accuracy")
     elif accuracy >= 60:
-        insights["strengths"].append("Good overall performance")
+        strengths.append("Good overall performance")
     else:
-        insights["weaknesses"].append("Overall accuracy needs improvement")
+        weaknesses.append("Overall accuracy needs improvement")
     
     # Analyze subject-wise performance
     for subject_result in result["subject_results"]:
@@ -218,23 +335,23 @@ def get_performance_insights(
         subject_acc = subject_result["accuracy"]
         
         if subject_acc >= 80:
-            insights["strengths"].append(f"Strong performance in {subject}")
+            strengths.append(f"Strong performance in {subject}")
         elif subject_acc < 50:
-            insights["weaknesses"].append(f"Weak performance in {subject}")
-            insights["recommendations"].append(
+            weaknesses.append(f"Weak performance in {subject}")
+            recommendations.append(
                 f"Focus more on {subject} - review concepts and practice more questions"
             )
     
     # Analyze attempt rate
-    attempt_rate = (result["attempted"] / result["total_questions"]) * 100
+    attempt_rate = result["attempted"] / (result["total_questions"] or 1) * 100
     if attempt_rate < 80:
-        insights["recommendations"].append(
+        recommendations.append(
             "Try to attempt more questions - unattempted questions give 0 marks"
         )
     
     # Analyze negative marking impact
     if result["negative_marks"] > result["positive_marks"] * 0.3:
-        insights["recommendations"].append(
+        recommendations.append(
             "Be more careful with answers - high negative marking detected"
         )
     
@@ -3,7 +3,9 @@ Exam configuration including syllabus and marking schemes.
 Provides structured configuration with validation.
 """
 
-from typing import Dict, List
+import sys
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Tuple
 
 # Comprehensive syllabus for JEE and NEET
 SYLLABUS: Dict[str, Dict[str, List[str]]] = {
@@ -297,6 +299,13 @@ SYLLABUS: Dict[str, Dict[str, List[str]]] = {
     }
 }
 
+# Intern exam and subject names so that interned request values (the CLI's
+# exam, evaluate's subjects) match these keys by identity
+SYLLABUS = {
+    sys.intern(exam): {sys.intern(subject): chapters for subject, chapters in subjects.items()}
+    for exam, subjects in SYLLABUS.items()
+}
+
 
 # Marking schemes for different exams
 MARKING_SCHEME: Dict[str, Dict[str, int]] = {
@@ -322,23 +331,52 @@ MARKING_SCHEME: Dict[str, Dict[str, int]] = {
     }
 }
 
+# Read-only views: the schemes are shared by every caller, never copied
+MARKING_SCHEME = MappingProxyType({
+    exam: MappingProxyType(scheme) for exam, scheme in MARKING_SCHEME.items()
+})
+
 
 # Difficulty levels
 DIFFICULTY_LEVELS = ["Easy", "Medium", "Hard"]
 
 
-def get_subjects(exam: str) -> List[str]:
-    """Get list of subjects for an exam."""
-    return list(SYLLABUS.get(exam, {}).keys())
+# Immutable snapshots of the syllabus, built once at import
+_SUBJECTS_CACHE: Dict[str, Tuple[str, ...]] = {
+    exam: tuple(subjects) for exam, subjects in SYLLABUS.items()
+}
+_CHAPTERS_CACHE: Dict[Tuple[str, str], Tuple[str, ...]] = {
+    (exam, subject): tuple(chapters)
+    for exam, subjects in SYLLABUS.items()
+    for subject, chapters in subjects.items()
+}
+
+# Chapter lookup sets keyed by (exam, subject)
+_CHAPTER_SETS: Dict[Tuple[str, str], FrozenSet[str]] = {
+    (exam, subject): frozenset(chapters)
+    for exam, subjects in SYLLABUS.items()
+    for subject, chapters in subjects.items()
+}
+_EMPTY_SET: FrozenSet[str] = frozenset()
+
+
+def get_subjects(exam: str) -> Tuple[str, ...]:
+    """Get the subjects for an exam (read-only tuple)."""
+    return _SUBJECTS_CACHE.get(exam, ())
+
+
+def get_chapters(exam: str, subject: str) -> Tuple[str, ...]:
+    """Get the chapters for a subject (read-only tuple)."""
+    return _CHAPTERS_CACHE.get((exam, subject), ())
 
 
-def get_chapters(exam: str, subject: str) -> List[str]:
-    """Get list of chapters for a subject."""
-    return SYLLABUS.get(exam, {}).get(subject, [])
+def get_chapter_set(exam: str, subject: str) -> FrozenSet[str]:
+    """Get the chapters for a subject as a set for membership checks."""
+    return _CHAPTER_SETS.get((exam, subject), _EMPTY_SET)
 
 
-def get_marking_scheme(exam: str) -> Dict[str, int]:
-    """Get marking scheme for an exam."""
+def get_marking_scheme(exam: str) -> Mapping[str, float]:
+    """Get marking scheme for an exam (read-only mapping)."""
     return MARKING_SCHEME.get(exam, MARKING_SCHEME["JEE"])
 
 
@@ -354,4 +392,4 @@ def is_valid_subject(exam: str, subject: str) -> bool:
 
 def is_valid_chapter(exam: str, subject: str, chapter: str) -> bool:
     """Check if chapter is valid for the subject."""
-    return chapter in SYLLABUS.get(exam, {}).get(subject, [])
+    return chapter in _CHAPTER_SETS.get((exam, subject), _EMPTY_SET)
@@ -3,15 +3,39 @@ Custom exceptions for the AI generation module.
 Provides a clear exception hierarchy for different error types.
 """
 
+from typing import Optional, Sequence
+
 
 class AIGenException(Exception):
-    """Base exception for all AI generation errors."""
+    """
+    Base exception for all AI generation errors.
+    
+    Every subclass declares its attributes in __slots__, so raising one
+    never materialises a per-instance __dict__.
+    """
+    
+    __slots__ = ("message", "details")
     
     def __init__(self, message: str, details: dict = None):
         super().__init__(message)
         self.message = message
         self.details = details or {}
     
+    def __reduce__(self):
+        # Exception's default reduce only carries args and __dict__; rebuild
+        # without re-running __init__ and restore the slot values instead
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+            if hasattr(self, name)
+        }
+        return (type(self).__new__, (type(self),) + self.args, state)
+    
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+    
     def __str__(self):
         if self.details:
             return f"{self.message} | Details: {self.details}"
@@ -20,12 +44,15 @@ class AIGenException(Exception):
 
 class LLMServiceError(AIGenException):
     """Raised when LLM service encounters an error."""
-    pass
+    
+    __slots__ = ()
 
 
 class APIError(LLMServiceError):
     """Raised when API call fails."""
     
+    __slots__ = ("status_code", "response")
+    
     def __init__(self, message: str, status_code: int = None, response: str = None):
         super().__init__(message, {"status_code": status_code, "response": response})
         self.status_code = status_code
@@ -35,6 +62,8 @@ class APIError(LLMServiceError):
 class RateLimitError(LLMServiceError):
     """Raised when API rate limit is exceeded."""
     
+    __slots__ = ("retry_after",)
+    
     def __init__(self, message: str, retry_after: int = None):
         super().__init__(message, {"retry_after": retry_after})
         self.retry_after = retry_after
@@ -42,12 +71,15 @@ class RateLimitError(LLMServiceError):
 
 class TimeoutError(LLMServiceError):
     """Raised when API request times out."""
-    pass
+    
+    __slots__ = ()
 
 
 class ParsingError(AIGenException):
     """Raised when parsing LLM output fails."""
     
+    __slots__ = ("raw_text", "subject")
+    
     def __init__(self, message: str, raw_text: str = None, subject: str = None):
         super().__init__(message, {"subject": subject, "text_length": len(raw_text) if raw_text else 0})
         self.raw_text = raw_text
@@ -57,6 +89,8 @@ class ParsingError(AIGenException):
 class ValidationError(AIGenException):
     """Raised when data validation fails."""
     
+    __slots__ = ("field", "value")
+    
     def __init__(self, message: str, field: str = None, value: any = None):
         super().__init__(message, {"field": field, "value": str(value) if value else None})
         self.field = field
@@ -66,15 +100,19 @@ class ValidationError(AIGenException):
 class QuestionValidationError(ValidationError):
     """Raised when question validation fails."""
     
-    def __init__(self, message: str, question_id: int = None, missing_fields: list = None):
+    __slots__ = ("question_id", "missing_fields")
+    
+    def __init__(self, message: str, question_id: int = None, missing_fields: Sequence[str] = ()):
         super().__init__(message, field="question", value=question_id)
         self.question_id = question_id
-        self.missing_fields = missing_fields or []
+        self.missing_fields = missing_fields or ()
 
 
 class ConfigurationError(AIGenException):
     """Raised when configuration is invalid or missing."""
     
+    __slots__ = ("config_key",)
+    
     def __init__(self, message: str, config_key: str = None):
         super().__init__(message, {"config_key": config_key})
         self.config_key = config_key
@@ -83,6 +121,8 @@ class ConfigurationError(AIGenException):
 class PDFGenerationError(AIGenException):
     """Raised when PDF generation fails."""
     
+    __slots__ = ("page_number",)
+    
     def __init__(self, message: str, page_number: int = None):
         super().__init__(message, {"page_number": page_number})
         self.page_number = page_number
@@ -91,6 +131,8 @@ class PDFGenerationError(AIGenException):
 class InsufficientQuestionsError(AIGenException):
     """Raised when not enough questions are generated."""
     
+    __slots__ = ("requested", "generated", "subject")
+    
     def __init__(self, requested: int, generated: int, subject: str = None):
         message = f"Insufficient questions: requested {requested}, generated {generated}"
         super().__init__(message, {"requested": requested, "generated": generated, "subject": subject})
@@ -102,8 +144,11 @@ class InsufficientQuestionsError(AIGenException):
 class InvalidExamTypeError(ValidationError):
     """Raised when exam type is invalid."""
     
-    def __init__(self, exam_type: str, valid_types: list):
-        message = f"Invalid exam type: {exam_type}. Valid types: {', '.join(valid_types)}"
+    __slots__ = ("exam_type", "valid_types")
+    
+    def __init__(self, exam_type: str, valid_types: Sequence[str], valid_types_str: Optional[str] = None):
+        # Callers with a fixed list pass it pre-joined to skip the join per raise
+        message = f"Invalid exam type: {exam_type}. Valid types: {valid_types_str or ', '.join(valid_types)}"
         super().__init__(message, field="exam_type", value=exam_type)
         self.exam_type = exam_type
         self.valid_types = valid_types
@@ -112,7 +157,9 @@ class InvalidExamTypeError(ValidationError):
 class InvalidSubjectError(ValidationError):
     """Raised when subject is invalid for the given exam."""
     
-    def __init__(self, subject: str, exam: str, valid_subjects: list):
+    __slots__ = ("subject", "exam", "valid_subjects")
+    
+    def __init__(self, subject: str, exam: str, valid_subjects: Sequence[str]):
         message = f"Invalid subject '{subject}' for {exam}. Valid subjects: {', '.join(valid_subjects)}"
         super().__init__(message, field="subject", value=subject)
         self.subject = subject
@@ -123,8 +170,10 @@ class InvalidSubjectError(ValidationError):
 class InvalidDifficultyError(ValidationError):
     """Raised when difficulty level is invalid."""
     
-    def __init__(self, difficulty: str, valid_levels: list):
-        message = f"Invalid difficulty: {difficulty}. Valid levels: {', '.join(valid_levels)}"
+    __slots__ = ("difficulty", "valid_levels")
+    
+    def __init__(self, difficulty: str, valid_levels: Sequence[str], valid_levels_str: Optional[str] = None):
+        message = f"Invalid difficulty: {difficulty}. Valid levels: {valid_levels_str or ', '.join(valid_levels)}"
         super().__init__(message, field="difficulty", value=difficulty)
         self.difficulty = difficulty
         self.valid_levels = valid_levels
@@ -4,16 +4,27 @@ Provides robust API interaction with retry logic, error handling, and logging.
 """
 
 import os
+import re
+import importlib.util
 import time
-from typing import Optional
+import random
+import asyncio
+import threading
+from typing import Iterator, List, Optional, Tuple, Union
 from dotenv import load_dotenv
+import httpx
 from google import genai
 from google.genai import types
+from google.genai import errors as genai_errors
 
 from .logger import get_logger
+from .cache import get_llm_cache, llm_cache_key
 from .constants import (
     DEFAULT_MODEL, DEFAULT_TEMPERATURE, DEFAULT_LOCATION, API_TIMEOUT,
     MAX_RETRIES, RETRY_DELAY, RETRY_BACKOFF_FACTOR,
+    MAX_RETRY_DELAY, RETRY_JITTER, LLM_CACHE_MAX_TEMPERATURE,
+    CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_COOLDOWN,
+    HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS,
     ERROR_API_KEY_MISSING
 )
 from .exceptions import (
@@ -24,8 +35,146 @@ from .exceptions import (
 # Initialize logger
 logger = get_logger("llm_service")
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from .env only when the deployment has not
+# already configured them (skips the file read and parse in production)
+if not os.getenv("GOOGLE_CLOUD_PROJECT"):
+    load_dotenv()
+
+# Error-message classifiers, compiled once. Case-insensitive so untyped
+# errors are scanned in one pass without building a lowercased copy
+_RATE_LIMIT_RE = re.compile(r"quota|429|rate limit|resource[ _]exhausted", re.IGNORECASE)
+_TIMEOUT_RE = re.compile(r"timeout|504", re.IGNORECASE)
+_RETRY_RE = re.compile(r"retry in (\d+(?:\.\d+)?)s", re.IGNORECASE)
+
+# Failure kinds, and the provider status codes that map to them. Other
+# 4xx client errors (bad request, auth, not found) will fail the same way
+# on every attempt and are not retried
+_RATE_LIMIT = "rate_limit"
+_TIMEOUT = "timeout"
+_GENERIC = "generic"
+_NOT_RETRYABLE = "not_retryable"
+_STATUS_KINDS = {
+    429: _RATE_LIMIT,
+    408: _TIMEOUT,
+    504: _TIMEOUT,
+}
+
+
+def _classify_error(error: Exception) -> str:
+    """
+    Classify a failed LLM call.
+    
+    Typed provider errors are dispatched on their HTTP status code; the
+    error message is only inspected for exceptions that carry no status.
+    
+    Args:
+        error: Exception raised by the attempt
+        
+    Returns:
+        One of _RATE_LIMIT, _TIMEOUT, _NOT_RETRYABLE or _GENERIC
+    """
+    if isinstance(error, genai_errors.APIError):
+        kind = _STATUS_KINDS.get(error.code)
+        if kind is not None:
+            return kind
+        if isinstance(error, genai_errors.ClientError):
+            return _NOT_RETRYABLE
+        return _GENERIC
+    if isinstance(error, (httpx.TimeoutException, TimeoutError)):
+        return _TIMEOUT
+    
+    # Last resort for untyped errors
+    error_msg = str(error)
+    if _RATE_LIMIT_RE.search(error_msg) is not None:
+        return _RATE_LIMIT
+    if _TIMEOUT_RE.search(error_msg) is not None:
+        return _TIMEOUT
+    return _GENERIC
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """
+    Extract the wait time a rate-limited response asked for.
+    
+    Typed provider errors are read from the Retry-After header, then from
+    their short message; only untyped errors have their full string
+    rendered and scanned for a "retry in Ns" hint.
+    
+    Args:
+        error: Rate-limit exception raised by the attempt
+        
+    Returns:
+        Requested wait in seconds, or None if the error does not say
+    """
+    if isinstance(error, genai_errors.APIError):
+        headers = getattr(error.response, "headers", None)
+        if headers:
+            header = headers.get("Retry-After")
+            if header:
+                try:
+                    return float(header)
+                except ValueError:
+                    pass  # HTTP-date form; fall back to the message
+        message = error.message or ""
+    else:
+        message = str(error)
+    
+    match = _RETRY_RE.search(message)
+    return float(match.group(1)) if match else None
+
+
+def _compute_backoff(attempt: int, base: float) -> float:
+    """
+    Compute a jittered exponential backoff delay.
+    
+    The random spread keeps concurrent workers that failed together from
+    retrying in lockstep and colliding again.
+    
+    Args:
+        attempt: Zero-based attempt number that just failed
+        base: Initial delay (seconds)
+        
+    Returns:
+        Delay in seconds, capped at MAX_RETRY_DELAY
+    """
+    delay = base * (RETRY_BACKOFF_FACTOR ** attempt) * (1 + random.random() * RETRY_JITTER)
+    return min(MAX_RETRY_DELAY, delay)
+
+
+def _create_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    Create the pooled HTTP clients used by one LLM service.
+    
+    Sync and async calls each get a single keep-alive pool, so repeated and
+    concurrent calls reuse warm TLS connections. HTTP/2 is enabled when the
+    optional h2 package is installed, letting concurrent calls multiplex
+    over one connection. Requests time out after API_TIMEOUT seconds.
+    
+    The async pool's connections belong to the event loop that opened
+    them, so the service only uses it from its own loop (see
+    LLMService._service_loop).
+    
+    Returns:
+        Tuple of (sync client, async client)
+    """
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+    )
+    http2 = importlib.util.find_spec("h2") is not None
+    return (
+        httpx.Client(limits=limits, http2=http2, timeout=API_TIMEOUT),
+        httpx.AsyncClient(limits=limits, http2=http2, timeout=API_TIMEOUT)
+    )
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Run an event loop on the current thread until stopped, then close it."""
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
 
 
 class LLMService:
@@ -51,6 +200,15 @@ class LLMService:
         self.model = model
         self.temperature = temperature
         self.location = location
+        # Set by close() to cut short any retry backoff in progress
+        self._closing = threading.Event()
+        # Circuit breaker state (consecutive failed calls, monotonic reopen time)
+        self._cb_lock = threading.Lock()
+        self._cb_failures = 0
+        self._cb_open_until = 0.0
+        # Event loop thread that owns the async HTTP client, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
         
         # Get Project ID
         self.project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
@@ -88,21 +246,279 @@ class LLMService:
                 os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = temp_creds_path
                 logger.info(f"Credentials written to temporary file: {temp_creds_path}")
             
+            self._http_client, self._async_http_client = _create_http_clients()
             self.client = genai.Client(
                 vertexai=True,
                 project=self.project_id,
-                location=self.location
+                location=self.location,
+                http_options=types.HttpOptions(
+                    httpx_client=self._http_client,
+                    httpx_async_client=self._async_http_client,
+                    # The client passes this per request (in milliseconds),
+                    # overriding the pools' own default
+                    timeout=API_TIMEOUT * 1000
+                )
             )
             logger.info(f"LLM Service initialized (Vertex AI) with model: {self.model}, project: {self.project_id}")
         except Exception as e:
             logger.error(f"Failed to initialize Vertex AI Client: {str(e)}")
             raise ConfigurationError(f"Failed to initialize Vertex AI Client: {str(e)}")
     
+    def close(self) -> None:
+        """Close both HTTP connection pools and abort pending backoffs."""
+        self._closing.set()
+        self._http_client.close()
+        loop = self._loop
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self._async_http_client.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+    
+    async def aclose(self) -> None:
+        """Close both HTTP connection pools and abort pending backoffs."""
+        self._closing.set()
+        self._http_client.close()
+        loop = self._loop
+        if loop is None:
+            await self._async_http_client.aclose()
+            return
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self._async_http_client.aclose(), loop)
+        )
+        loop.call_soon_threadsafe(loop.stop)
+    
+    def _service_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the event loop that runs every async request, starting it on first use.
+        
+        httpx ties pooled connections to the loop that opened them, and each
+        asyncio.run() makes a new loop that is closed afterwards. Running all
+        async requests on one long-lived loop thread lets the shared async
+        client be reused from any caller.
+        
+        Returns:
+            The service's event loop
+        """
+        if self._loop is None:
+            # Double-checked so concurrent first callers share one loop
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=_run_loop, args=(loop,),
+                        name="aigen-llm-loop", daemon=True
+                    ).start()
+                    self._loop = loop
+        return self._loop
+    
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """
+        Get the response cache key for a prompt.
+        
+        Args:
+            prompt: Prompt text
+            
+        Returns:
+            Cache key, or None if responses at this temperature should stay
+            varied and must not be cached
+        """
+        if self.temperature > LLM_CACHE_MAX_TEMPERATURE:
+            return None
+        return llm_cache_key(prompt, self.model, self.temperature)
+    
+    def _check_circuit(self) -> None:
+        """
+        Fail fast while the circuit breaker is open.
+        
+        Raises:
+            LLMServiceError: If recent calls kept failing and the cooldown
+                has not elapsed yet
+        """
+        remaining = self._cb_open_until - time.monotonic()
+        if remaining > 0:
+            raise LLMServiceError(
+                "Circuit open: LLM service is failing, not calling it",
+                details={"retry_after": round(remaining, 2)}
+            )
+    
+    def _record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self._cb_failures:
+            with self._cb_lock:
+                self._cb_failures = 0
+                self._cb_open_until = 0.0
+    
+    def _record_failure(self) -> None:
+        """Count a call that exhausted its retries, opening the circuit at the threshold."""
+        with self._cb_lock:
+            self._cb_failures += 1
+            if self._cb_failures >= CIRCUIT_BREAKER_THRESHOLD:
+                self._cb_open_until = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN
+                logger.warning(
+                    "Circuit opened after %d consecutive failed calls (cooldown %.0fs)",
+                    self._cb_failures, CIRCUIT_BREAKER_COOLDOWN
+                )
+    
+    def health(self) -> dict:
+        """
+        Report circuit breaker state, e.g. for readiness probes.
+        
+        Returns:
+            Dictionary with circuit state, consecutive failures and the
+            seconds left until calls are attempted again
+        """
+        remaining = max(0.0, self._cb_open_until - time.monotonic())
+        return {
+            "circuit": "open" if remaining else "closed",
+            "consecutive_failures": self._cb_failures,
+            "retry_after": round(remaining, 2)
+        }
+    
+    def _generation_config(self) -> types.GenerateContentConfig:
+        """
+        Build the generation config shared by sync and async calls.
+        
+        Returns:
+            Generation config
+        """
+        # max_output_tokens: Limit output to prevent over-generation
+        # ~300 tokens per question * 50 questions = 15000, add buffer = 18000
+        return types.GenerateContentConfig(
+            temperature=self.temperature,
+            candidate_count=1,
+            max_output_tokens=18000  # Hard limit to prevent generating >50 questions
+        )
+    
+    def _response_text(self, response, attempt: int, max_retries: int, start_time: float) -> str:
+        """
+        Validate a response and extract its text.
+        
+        Args:
+            response: Response returned by the client
+            attempt: Zero-based attempt number
+            max_retries: Maximum number of retry attempts
+            start_time: perf_counter() reading taken when the attempt started
+            
+        Returns:
+            LLM response text
+            
+        Raises:
+            APIError: If the response has no text
+        """
+        duration = time.perf_counter() - start_time
+        logger.info("LLM call successful (attempt %d/%d, %.2fs)", attempt + 1, max_retries, duration)
+        
+        # Validate response
+        if not response or not response.text:
+            raise APIError("Invalid response from LLM: empty text")
+        
+        response_text = response.text
+        logger.debug("Response length: %d chars", len(response_text))
+        self._record_success()
+        return response_text
+    
+    def _backoff(self, sleep_time: float) -> None:
+        """
+        Sleep before a sync retry.
+        
+        Waits on the closing event rather than time.sleep, so close() from
+        another thread wakes the caller instead of leaving it parked for
+        the rest of a (possibly 30s) backoff window.
+        
+        Args:
+            sleep_time: Seconds to wait
+            
+        Raises:
+            LLMServiceError: If the service is closed while waiting
+        """
+        if self._closing.wait(sleep_time):
+            raise LLMServiceError("LLM service closed during retry backoff")
+    
+    def _handle_failure(
+        self,
+        error: Exception,
+        attempt: int,
+        max_retries: int,
+        retry_delay: float
+    ) -> float:
+        """
+        Classify a failed attempt and decide how long to back off.
+        
+        Args:
+            error: Exception raised by the attempt
+            attempt: Zero-based attempt number
+            max_retries: Maximum number of retry attempts
+            retry_delay: Initial delay between retries (seconds)
+            
+        Returns:
+            Seconds to sleep before retrying
+            
+        Raises:
+            APIError: If the provider rejected the request (not retried)
+            RateLimitError: If rate limited on the last attempt
+            AITimeoutError: If timed out on the last attempt
+            LLMServiceError: If any other error occurs on the last attempt
+        """
+        kind = _classify_error(error)
+        
+        # The request itself is bad; retrying cannot help, and it says
+        # nothing about the endpoint's health, so leave the circuit alone
+        if kind is _NOT_RETRYABLE:
+            logger.error("LLM request rejected (%s %s): %s", error.code, error.status, error.message)
+            raise APIError(
+                f"LLM request rejected: {error.code} {error.status}",
+                status_code=error.code,
+                response=error.message
+            )
+        
+        is_last_attempt = attempt >= max_retries - 1
+        if is_last_attempt:
+            self._record_failure()
+        backoff = _compute_backoff(attempt, retry_delay)
+        
+        # Check for rate limiting
+        if kind is _RATE_LIMIT:
+            logger.warning("Rate limit hit on attempt %d/%d", attempt + 1, max_retries)
+            
+            # Honour the wait time the API asked for, if any
+            wait_time = backoff
+            requested = _retry_after(error)
+            if requested is not None:
+                wait_time = requested + 1.0  # Add 1s buffer
+                logger.info("API requested wait of %.2fs", wait_time)
+            
+            if is_last_attempt:
+                raise RateLimitError(
+                    f"Rate limit exceeded after {max_retries} attempts",
+                    retry_after=int(wait_time)
+                )
+            sleep_time = max(wait_time, backoff)
+            logger.info("Retrying after %.2fs...", sleep_time)
+            return sleep_time
+        
+        # Check for timeout
+        if kind is _TIMEOUT:
+            logger.warning("Request timeout on attempt %d/%d", attempt + 1, max_retries)
+            if is_last_attempt:
+                raise AITimeoutError(f"Request timed out after {max_retries} attempts")
+            logger.info("Retrying after %.2fs...", backoff)
+            return backoff
+        
+        # Generic error
+        message = str(error)
+        logger.error("LLM call failed on attempt %d/%d: %s", attempt + 1, max_retries, message)
+        if is_last_attempt:
+            raise LLMServiceError(
+                f"LLM call failed after {max_retries} attempts: {message}"
+            )
+        logger.info("Retrying after %.2fs...", backoff)
+        return backoff
+    
     def call(
         self,
         prompt: str,
         max_retries: int = MAX_RETRIES,
-        retry_delay: float = RETRY_DELAY
+        retry_delay: float = RETRY_DELAY,
+        use_cache: bool = True
     ) -> str:
         """
         Call LLM with retry logic and error handling.
@@ -111,30 +527,31 @@ class LLMService:
             prompt: Prompt to send to LLM
             max_retries: Maximum number of retry attempts
             retry_delay: Initial delay between retries (seconds)
+            use_cache: Whether to reuse/store identical responses (only
+                applies at temperatures up to LLM_CACHE_MAX_TEMPERATURE)
             
         Returns:
             LLM response text
             
         Raises:
-            LLMServiceError: If all retry attempts fail
+            LLMServiceError: If all retry attempts fail or the circuit is open
         """
-        logger.debug(f"Calling LLM with prompt length: {len(prompt)} chars")
+        logger.debug("Calling LLM with prompt length: %d chars", len(prompt))
         
-        last_exception = None
-        current_delay = retry_delay
+        cache_key = self._cache_key(prompt) if use_cache else None
+        if cache_key is not None:
+            cached = get_llm_cache().get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached LLM response")
+                return cached
         
-        # Configuration for generation
-        # max_output_tokens: Limit output to prevent over-generation
-        # ~300 tokens per question * 50 questions = 15000, add buffer = 18000
-        config = types.GenerateContentConfig(
-            temperature=self.temperature,
-            candidate_count=1,
-            max_output_tokens=18000  # Hard limit to prevent generating >50 questions
-        )
+        self._check_circuit()
+        last_exception = None
+        config = self._generation_config()
         
         for attempt in range(max_retries):
             try:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Make API call using Vertex AI Client
                 response = self.client.models.generate_content(
@@ -142,79 +559,207 @@ class LLMService:
                     contents=prompt,
                     config=config
                 )
+                response_text = self._response_text(response, attempt, max_retries, start_time)
+                if cache_key is not None:
+                    get_llm_cache().set(cache_key, response_text)
+                return response_text
+                
+            except Exception as e:
+                last_exception = e
+                sleep_time = self._handle_failure(e, attempt, max_retries, retry_delay)
+                self._backoff(sleep_time)
+        
+        # Should not reach here
+        raise LLMServiceError(
+            f"LLM call failed after {max_retries} attempts",
+            details={"last_error": str(last_exception)}
+        )
+    
+    def stream(
+        self,
+        prompt: str,
+        max_retries: int = MAX_RETRIES,
+        retry_delay: float = RETRY_DELAY
+    ) -> Iterator[str]:
+        """
+        Stream the LLM response as text chunks while it is generated.
+        
+        Lets callers start consuming (e.g. parsing complete question
+        blocks) before the whole response has arrived. Failures before the
+        first chunk are retried like call(); once text has been yielded a
+        failure cannot be retried transparently and is raised instead.
+        Streamed responses are not cached.
+        
+        Args:
+            prompt: Prompt to send to LLM
+            max_retries: Maximum number of retry attempts
+            retry_delay: Initial delay between retries (seconds)
+            
+        Yields:
+            Response text chunks, in order
+            
+        Raises:
+            LLMServiceError: If all retry attempts fail, the circuit is open
+                or the stream breaks
+        """
+        logger.debug("Streaming LLM response for prompt length: %d chars", len(prompt))
+        
+        self._check_circuit()
+        last_exception = None
+        config = self._generation_config()
+        
+        for attempt in range(max_retries):
+            emitted = False
+            try:
+                start_time = time.perf_counter()
                 
-                duration = time.time() - start_time
-                logger.info(f"LLM call successful (attempt {attempt + 1}/{max_retries}, {duration:.2f}s)")
+                for chunk in self.client.models.generate_content_stream(
+                    model=self.model,
+                    contents=prompt,
+                    config=config
+                ):
+                    text = chunk.text
+                    if text:
+                        emitted = True
+                        yield text
                 
-                # Validate response
-                if not response or not response.text:
+                if not emitted:
                     raise APIError("Invalid response from LLM: empty text")
                 
-                response_text = response.text
-                logger.debug(f"Response length: {len(response_text)} chars")
-                return response_text
+                duration = time.perf_counter() - start_time
+                logger.info("LLM stream complete (attempt %d/%d, %.2fs)", attempt + 1, max_retries, duration)
+                self._record_success()
+                return
                 
             except Exception as e:
+                if emitted:
+                    logger.error("LLM stream interrupted: %s", e)
+                    raise LLMServiceError(f"LLM stream interrupted: {str(e)}")
                 last_exception = e
-                error_msg = str(e).lower()
-                
-                # Check for rate limiting
-                if "429" in error_msg or "rate limit" in error_msg or "quota" in error_msg or "resource exhausted" in error_msg:
-                    logger.warning(f"Rate limit hit on attempt {attempt + 1}/{max_retries}")
-                    
-                    # Try to extract wait time from error message
-                    import re
-                    wait_time = current_delay
-                    match = re.search(r"retry in (\d+(\.\d+)?)s", error_msg)
-                    if match:
-                        wait_time = float(match.group(1)) + 1.0  # Add 1s buffer
-                        logger.info(f"API requested wait of {wait_time:.2f}s")
-                    
-                    if attempt < max_retries - 1:
-                        sleep_time = max(wait_time, current_delay)
-                        logger.info(f"Retrying after {sleep_time:.2f}s...")
-                        time.sleep(sleep_time)
-                        current_delay = max(current_delay * RETRY_BACKOFF_FACTOR, sleep_time)
-                        continue
-                    else:
-                        raise RateLimitError(
-                            f"Rate limit exceeded after {max_retries} attempts",
-                            retry_after=int(wait_time)
-                        )
+                sleep_time = self._handle_failure(e, attempt, max_retries, retry_delay)
+                self._backoff(sleep_time)
+        
+        # Should not reach here
+        raise LLMServiceError(
+            f"LLM call failed after {max_retries} attempts",
+            details={"last_error": str(last_exception)}
+        )
+    
+    async def acall(
+        self,
+        prompt: str,
+        max_retries: int = MAX_RETRIES,
+        retry_delay: float = RETRY_DELAY,
+        use_cache: bool = True
+    ) -> str:
+        """
+        Asynchronous version of call(), using the client's async API.
+        
+        Backoff sleeps yield to the event loop, so other calls keep making
+        progress while this one waits to retry. The request runs on the
+        service's own loop (see _service_loop); a caller on any other loop
+        awaits it from there.
+        
+        Args:
+            prompt: Prompt to send to LLM
+            max_retries: Maximum number of retry attempts
+            retry_delay: Initial delay between retries (seconds)
+            use_cache: Whether to reuse/store identical responses (only
+                applies at temperatures up to LLM_CACHE_MAX_TEMPERATURE)
+            
+        Returns:
+            LLM response text
+            
+        Raises:
+            LLMServiceError: If all retry attempts fail or the circuit is open
+        """
+        loop = self._service_loop()
+        request = self._acall(prompt, max_retries, retry_delay, use_cache)
+        if asyncio.get_running_loop() is loop:
+            return await request
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(request, loop))
+    
+    async def _acall(
+        self,
+        prompt: str,
+        max_retries: int,
+        retry_delay: float,
+        use_cache: bool
+    ) -> str:
+        """
+        Make an async call with retries on the current event loop.
+        
+        Args:
+            prompt: Prompt to send to LLM
+            max_retries: Maximum number of retry attempts
+            retry_delay: Initial delay between retries (seconds)
+            use_cache: Whether to reuse/store identical responses (only
+                applies at temperatures up to LLM_CACHE_MAX_TEMPERATURE)
+            
+        Returns:
+            LLM response text
+            
+        Raises:
+            LLMServiceError: If all retry attempts fail or the circuit is open
+        """
+        logger.debug("Calling LLM (async) with prompt length: %d chars", len(prompt))
+        
+        cache_key = self._cache_key(prompt) if use_cache else None
+        if cache_key is not None:
+            cached = get_llm_cache().get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached LLM response")
+                return cached
+        
+        self._check_circuit()
+        last_exception = None
+        config = self._generation_config()
+        
+        for attempt in range(max_retries):
+            try:
+                start_time = time.perf_counter()
                 
-                # Check for timeout
-                elif "timeout" in error_msg or "504" in error_msg:
-                    logger.warning(f"Request timeout on attempt {attempt + 1}/{max_retries}")
-                    if attempt < max_retries - 1:
-                        logger.info(f"Retrying after {current_delay}s...")
-                        time.sleep(current_delay)
-                        current_delay *= RETRY_BACKOFF_FACTOR
-                        continue
-                    else:
-                        raise AITimeoutError(f"Request timed out after {max_retries} attempts")
+                response = await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=prompt,
+                    config=config
+                )
+                response_text = self._response_text(response, attempt, max_retries, start_time)
+                if cache_key is not None:
+                    get_llm_cache().set(cache_key, response_text)
+                return response_text
                 
-                # Generic error
-                else:
-                    logger.error(f"LLM call failed on attempt {attempt + 1}/{max_retries}: {str(e)}")
-                    if attempt < max_retries - 1:
-                        logger.info(f"Retrying after {current_delay}s...")
-                        time.sleep(current_delay)
-                        current_delay *= RETRY_BACKOFF_FACTOR
-                        continue
-                    else:
-                        raise LLMServiceError(
-                            f"LLM call failed after {max_retries} attempts: {str(e)}"
-                        )
+            except Exception as e:
+                last_exception = e
+                sleep_time = self._handle_failure(e, attempt, max_retries, retry_delay)
+                await asyncio.sleep(sleep_time)
         
         # Should not reach here
         raise LLMServiceError(
             f"LLM call failed after {max_retries} attempts",
             details={"last_error": str(last_exception)}
         )
+    
+    async def abatch(self, prompts: List[str]) -> List[Union[str, Exception]]:
+        """
+        Send several independent prompts concurrently.
+        
+        Args:
+            prompts: Prompts to send
+            
+        Returns:
+            One entry per prompt, in order: the response text, or the
+            exception that call raised (failures do not cancel the others)
+        """
+        return await asyncio.gather(
+            *(self.acall(prompt) for prompt in prompts),
+            return_exceptions=True
+        )
 
 
 # Global LLM service instance
 _llm_service: Optional[LLMService] = None
+_llm_service_lock = threading.Lock()
 
 
 def get_llm_service() -> LLMService:
@@ -226,16 +771,20 @@ def get_llm_service() -> LLMService:
     """
     global _llm_service
     if _llm_service is None:
-        _llm_service = LLMService()
+        # Double-checked so concurrent first callers share one client
+        with _llm_service_lock:
+            if _llm_service is None:
+                _llm_service = LLMService()
     return _llm_service
 
 
-def call_llm(prompt: str) -> str:
+def call_llm(prompt: str, use_cache: bool = True) -> str:
     """
     Convenience function to call LLM.
     
     Args:
         prompt: Prompt to send to LLM
+        use_cache: Whether to reuse/store identical responses
         
     Returns:
         LLM response text
@@ -244,4 +793,52 @@ def call_llm(prompt: str) -> str:
         LLMServiceError: If LLM call fails
     """
     service = get_llm_service()
-    return service.call(prompt)
\ No newline at end of file
+    return service.call(prompt, use_cache=use_cache)
+
+
+async def acall_llm(prompt: str, use_cache: bool = True) -> str:
+    """
+    Convenience function to call LLM from a coroutine.
+    
+    Args:
+        prompt: Prompt to send to LLM
+        use_cache: Whether to reuse/store identical responses
+        
+    Returns:
+        LLM response text
+        
+    Raises:
+        LLMServiceError: If LLM call fails
+    """
+    service = get_llm_service()
+    return await service.acall(prompt, use_cache=use_cache)
+
+
+def stream_llm(prompt: str) -> Iterator[str]:
+    """
+    Convenience function to stream an LLM response.
+    
+    Args:
+        prompt: Prompt to send to LLM
+        
+    Yields:
+        Response text chunks
+    """
+    service = get_llm_service()
+    yield from service.stream(prompt)
+
+
+def call_llm_batch(prompts: List[str]) -> List[Union[str, Exception]]:
+    """
+    Convenience function to send independent prompts concurrently.
+    
+    Args:
+        prompts: Prompts to send to LLM
+        
+    Returns:
+        One entry per prompt: the response text or the exception raised
+    """
+    service = get_llm_service()
+    return asyncio.run_coroutine_threadsafe(
+        service.abatch(prompts), service._service_loop()
+    ).result()
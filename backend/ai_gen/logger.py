@@ -3,20 +3,56 @@ Logging configuration for the AI generation module.
 Provides structured logging with file rotation and different log levels.
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
 
-# Create logs directory if it doesn't exist
-LOGS_DIR = Path(__file__).parent.parent / "logs"
-LOGS_DIR.mkdir(exist_ok=True)
+# Logs directory (overridable, e.g. to point at tmpfs); created when the
+# first record is written to a log file
+LOGS_DIR = Path(os.environ.get("AI_GEN_LOG_DIR") or Path(__file__).parent.parent / "logs")
 
 # Log file paths
 MAIN_LOG_FILE = LOGS_DIR / "ai_gen.log"
 ERROR_LOG_FILE = LOGS_DIR / "ai_gen_error.log"
 
+# No format here uses thread or process fields; skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Queue listener driving each configured logger's handlers, by logger name
+_listeners: Dict[str, QueueListener] = {}
+
+
+class _LazyRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that touches the filesystem only on first write.
+    
+    The file is opened with delay=True and the logs directory is created
+    just before that first open, so importing the module (which sets up
+    the default logger) does no mkdir or open calls.
+    """
+    
+    def __init__(self, filename: Path, **kwargs):
+        """
+        Initialize handler.
+        
+        Args:
+            filename: Log file path
+            **kwargs: Passed to RotatingFileHandler
+        """
+        super().__init__(filename, delay=True, **kwargs)
+    
+    def _open(self):
+        """Create the logs directory, then open the log file."""
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
 
 def setup_logger(
     name: str = "ai_gen",
@@ -27,6 +63,10 @@ def setup_logger(
     """
     Set up and configure a logger with file and console handlers.
     
+    The handlers are driven by a background QueueListener; the logger
+    itself only gets a QueueHandler, so logging calls enqueue the record
+    and return without waiting on disk or stderr writes.
+    
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -43,48 +83,83 @@ def setup_logger(
     if logger.handlers:
         return logger
     
-    # Create formatters
+    # Create formatters (the caller location is only worth printing for errors)
     detailed_formatter = logging.Formatter(
         fmt='%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
+    file_formatter = logging.Formatter(
+        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    
     simple_formatter = logging.Formatter(
         fmt='%(asctime)s - %(levelname)s - %(message)s',
         datefmt='%H:%M:%S'
     )
     
-    # File handler for all logs (with rotation)
+    handlers = []
+    
+    # File handler for all logs (with rotation), opened on first write
     if log_to_file:
-        file_handler = RotatingFileHandler(
+        file_handler = _LazyRotatingFileHandler(
             MAIN_LOG_FILE,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5
         )
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(file_formatter)
+        handlers.append(file_handler)
         
         # Separate file handler for errors only
-        error_handler = RotatingFileHandler(
+        error_handler = _LazyRotatingFileHandler(
             ERROR_LOG_FILE,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(detailed_formatter)
-        logger.addHandler(error_handler)
+        handlers.append(error_handler)
     
     # Console handler
     if log_to_console:
         console_handler = logging.StreamHandler(sys.stderr)
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(simple_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Hand records to a listener thread that does the actual I/O; stopping
+    # it at exit drains whatever is still queued
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(QueueHandler(log_queue))
+        _listeners[name] = listener
     
     return logger
 
 
+def configure_worker_logging() -> None:
+    """
+    Make a worker process write log records through its handlers directly.
+    
+    A forked worker inherits each logger's QueueHandler but not the
+    listener thread that drains the queue, so its records would be
+    dropped. Used as a process pool initializer, this swaps the queue
+    handler for the listener's handlers in the child.
+    """
+    for name, listener in _listeners.items():
+        logger = logging.getLogger(name)
+        for handler in list(logger.handlers):
+            if isinstance(handler, QueueHandler):
+                logger.removeHandler(handler)
+        for handler in listener.handlers:
+            logger.addHandler(handler)
+
+
 # Create default logger instance
 logger = setup_logger()
 
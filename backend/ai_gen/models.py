@@ -3,11 +3,64 @@ Data models for the AI generation module using dataclasses.
 Provides type-safe structures for questions, configurations, and results.
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Dict, List, Optional, Any, get_args, get_origin
 from enum import Enum
 
 
+def _field_expr(name: str, annotation: Any) -> str:
+    """
+    Build the expression that converts one field for to_dict.
+    
+    Args:
+        name: Field name
+        annotation: Field type annotation
+        
+    Returns:
+        Python source for the converted value
+    """
+    origin = get_origin(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return f"self.{name}.value"
+    if origin is list:
+        args = get_args(annotation)
+        if args and is_dataclass(args[0]):
+            return f"[v.to_dict() for v in self.{name}]"
+        return f"list(self.{name})"
+    if origin is dict:
+        return f"dict(self.{name})"
+    return f"self.{name}"
+
+
+def fastdict(cls):
+    """
+    Generate a to_dict method for a dataclass from its fields.
+    
+    The method body is a single dict literal compiled once at class
+    creation, so conversion does no per-call reflection the way
+    dataclasses.asdict does. Enums become their values, nested dataclass
+    lists are converted recursively, and other lists and dicts are
+    shallow-copied. Private fields (leading underscore) are left out.
+    
+    Usage:
+        @fastdict
+        @dataclass(slots=True)
+        class Question:
+            ...
+    """
+    items = ", ".join(
+        f"{f.name!r}: {_field_expr(f.name, f.type)}"
+        for f in fields(cls) if not f.name.startswith("_")
+    )
+    namespace: Dict[str, Any] = {}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = "Convert to dictionary."
+    cls.to_dict = to_dict
+    return cls
+
+
 class ExamType(str, Enum):
     """Enum for exam types."""
     JEE = "JEE"
@@ -29,7 +82,8 @@ class AnswerOption(str, Enum):
     D = "D"
 
 
-@dataclass
+@fastdict
+@dataclass(slots=True)
 class Question:
     """Represents a single MCQ question."""
     id: int
@@ -42,10 +96,6 @@ class Question:
     difficulty: Optional[str] = None
     marks: int = 4
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
-    
     def validate(self) -> bool:
         """Validate question structure."""
         from .validators import validate_question
@@ -61,7 +111,8 @@ class Question:
             raise ValueError(f"Must have exactly 4 options, got {len(self.options)}")
 
 
-@dataclass
+@fastdict
+@dataclass(slots=True)
 class SubjectConfig:
     """Configuration for generating questions for a subject."""
     subject: str
@@ -69,10 +120,6 @@ class SubjectConfig:
     num_questions: int
     difficulty: str = "Medium"
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
-    
     def __post_init__(self):
         """Validate after initialization."""
         if self.num_questions < 1:
@@ -81,27 +128,21 @@ class SubjectConfig:
             raise ValueError("chapters list cannot be empty")
 
 
-@dataclass
+@fastdict
+@dataclass(slots=True)
 class ExamConfig:
     """Configuration for exam generation."""
     exam_type: ExamType
     subjects: List[SubjectConfig]
     total_duration: Optional[int] = 180  # minutes
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "exam_type": self.exam_type.value,
-            "subjects": [s.to_dict() for s in self.subjects],
-            "total_duration": self.total_duration
-        }
-    
     def get_total_questions(self) -> int:
         """Get total number of questions across all subjects."""
         return sum(s.num_questions for s in self.subjects)
 
 
-@dataclass
+@fastdict
+@dataclass(slots=True)
 class QuestionAttempt:
     """Represents a user's attempt at a question."""
     question_id: int
@@ -118,7 +159,8 @@ class QuestionAttempt:
         return self.user_answer is not None
 
 
-@dataclass
+@fastdict
+@dataclass(slots=True)
 class SubjectResult:
     """Results for a single subject."""
     subject: str
@@ -133,17 +175,12 @@ class SubjectResult:
     
     def __post_init__(self):
         """Calculate derived fields."""
-        if self.attempted > 0:
-            self.accuracy = (self.correct / self.attempted) * 100
-        else:
-            self.accuracy = 0.0
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
+        # A stored field, so orjson and dataclasses.asdict include it
+        self.accuracy = self.correct / self.attempted * 100 if self.attempted else 0.0
 
 
-@dataclass
+@fastdict
+@dataclass(slots=True)
 class EvaluationResult:
     """Complete evaluation result for a test."""
     total_marks: float
@@ -159,34 +196,24 @@ class EvaluationResult:
     question_details: List[Dict[str, Any]]
     time_taken: Optional[float] = None  # seconds
     percentile: Optional[float] = None
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "total_marks": self.total_marks,
-            "positive_marks": self.positive_marks,
-            "negative_marks": self.negative_marks,
-            "total_questions": self.total_questions,
-            "attempted": self.attempted,
-            "correct": self.correct,
-            "wrong": self.wrong,
-            "unattempted": self.unattempted,
-            "accuracy": self.accuracy,
-            "subject_results": [s.to_dict() for s in self.subject_results],
-            "question_details": self.question_details,
-            "time_taken": self.time_taken,
-            "percentile": self.percentile
-        }
+    _by_subject: Optional[Dict[str, SubjectResult]] = field(
+        init=False, default=None, repr=False, compare=False
+    )
     
     def get_subject_result(self, subject: str) -> Optional[SubjectResult]:
         """Get result for a specific subject."""
-        for result in self.subject_results:
-            if result.subject == subject:
-                return result
-        return None
-
-
-@dataclass
+        # Index built on first lookup; rebuilt if results were added since
+        index = self._by_subject
+        if index is None or len(index) != len(self.subject_results):
+            index = {}
+            for result in self.subject_results:
+                index.setdefault(result.subject, result)
+            self._by_subject = index
+        return index.get(subject)
+
+
+@fastdict
+@dataclass(slots=True)
 class MarkingScheme:
     """Marking scheme for an exam."""
     correct: int = 4
@@ -196,13 +223,10 @@ class MarkingScheme:
     def calculate_marks(self, correct_count: int, wrong_count: int, unattempted_count: int) -> float:
         """Calculate total marks based on counts."""
         return (correct_count * self.correct) + (wrong_count * self.wrong) + (unattempted_count * self.unattempted)
-    
-    def to_dict(self) -> Dict[str, int]:
-        """Convert to dictionary."""
-        return asdict(self)
 
 
-@dataclass
+@fastdict
+@dataclass(slots=True)
 class GenerationMetadata:
     """Metadata about question generation."""
     exam_type: str
@@ -212,7 +236,3 @@ class GenerationMetadata:
     model_used: str
     temperature: float
     success_rate: float  # percentage of successfully parsed questions
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
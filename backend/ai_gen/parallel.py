@@ -3,16 +3,86 @@ Parallel processing utilities for faster question generation.
 Enables concurrent generation for multiple subjects.
 """
 
+import asyncio
 import concurrent.futures
-from typing import Dict, List, Any, Tuple, Callable
+import threading
+from typing import Dict, List, Any, Tuple, Callable, Awaitable, Iterable, Iterator, Optional
 from functools import partial
 
-from .logger import get_logger
+from .logger import get_logger, configure_worker_logging
 from .exceptions import AIGenException
+from .constants import PARALLEL_POOL_SIZE
 
 # Initialize logger
 logger = get_logger("parallel")
 
+# Process-wide worker pool, created on first use and reused by every call
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Get or create the shared worker pool.
+    
+    Tasks run on it must not themselves block on further work submitted to
+    the same pool, or a saturated pool can deadlock.
+    
+    Returns:
+        Shared ThreadPoolExecutor
+    """
+    global _executor
+    if _executor is None:
+        # Double-checked so concurrent first callers share one pool
+        with _executor_lock:
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=PARALLEL_POOL_SIZE,
+                    thread_name_prefix="aigen"
+                )
+    return _executor
+
+
+def _run_bounded(
+    func: Callable,
+    items: Iterable[Any],
+    max_workers: int,
+    executor: Optional[concurrent.futures.Executor] = None
+) -> Iterator[Tuple[Any, concurrent.futures.Future]]:
+    """
+    Run func over items on a pool, at most max_workers at a time.
+    
+    Args:
+        func: Function to call for each item
+        items: Items to process
+        max_workers: Maximum number of items in flight for this call
+        executor: Pool to run on (defaults to the shared thread pool)
+        
+    Yields:
+        (item, future) pairs in completion order
+    """
+    if executor is None:
+        executor = get_executor()
+    remaining = iter(items)
+    pending = {}
+    
+    def submit_next() -> None:
+        for item in remaining:
+            pending[executor.submit(func, item)] = item
+            return
+    
+    for _ in range(max(1, max_workers)):
+        submit_next()
+    
+    while pending:
+        done, _ = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            item = pending.pop(future)
+            submit_next()
+            yield item, future
+
 
 def process_subjects_parallel(
     subjects: List[str],
@@ -23,6 +93,10 @@ def process_subjects_parallel(
     """
     Process multiple subjects in parallel.
     
+    Work runs on the shared pool from get_executor(), so no threads are
+    created or torn down per call; max_workers caps how many of this
+    call's subjects are in flight at once.
+    
     Args:
         subjects: List of subject names to process
         process_func: Function to call for each subject
@@ -43,25 +117,15 @@ def process_subjects_parallel(
     # Create partial function with common kwargs
     func_with_kwargs = partial(process_func, **common_kwargs)
     
-    # Process subjects in parallel
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_subject = {
-            executor.submit(func_with_kwargs, subject): subject
-            for subject in subjects
-        }
-        
-        # Collect results as they complete
-        for future in concurrent.futures.as_completed(future_to_subject):
-            subject = future_to_subject[future]
-            
-            try:
-                result = future.result()
-                results[subject] = result
-                logger.info(f"Successfully processed {subject}")
-            except Exception as e:
-                errors[subject] = str(e)
-                logger.error(f"Failed to process {subject}: {str(e)}")
+    # Process subjects in parallel, collecting results as they complete
+    for subject, future in _run_bounded(func_with_kwargs, subjects, max_workers):
+        try:
+            result = future.result()
+            results[subject] = result
+            logger.info(f"Successfully processed {subject}")
+        except Exception as e:
+            errors[subject] = str(e)
+            logger.error(f"Failed to process {subject}: {str(e)}")
     
     # Log summary
     logger.info(
@@ -79,6 +143,132 @@ def process_subjects_parallel(
     return results, errors
 
 
+async def process_subjects_parallel_async(
+    subjects: List[str],
+    process_func: Callable[..., Awaitable[Any]],
+    max_workers: int = 16,
+    **common_kwargs
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Process multiple subjects concurrently on the running event loop.
+    
+    Async counterpart of process_subjects_parallel for I/O-bound work: each
+    subject is a task rather than a pool thread, and a semaphore caps how
+    many are in flight at once.
+    
+    Args:
+        subjects: List of subject names to process
+        process_func: Coroutine function to call for each subject
+        max_workers: Maximum number of subjects in flight
+        **common_kwargs: Common keyword arguments for all subjects
+        
+    Returns:
+        Tuple of (results by subject, error messages by subject)
+        
+    Raises:
+        AIGenException: If processing fails for all subjects
+    """
+    logger.info(f"Starting async processing for {len(subjects)} subjects (limit {max_workers})")
+    
+    semaphore = asyncio.Semaphore(max_workers)
+    
+    async def bounded(subject: str) -> Any:
+        async with semaphore:
+            return await process_func(subject, **common_kwargs)
+    
+    outcomes = await asyncio.gather(
+        *(bounded(subject) for subject in subjects),
+        return_exceptions=True
+    )
+    
+    results = {}
+    errors = {}
+    for subject, outcome in zip(subjects, outcomes):
+        if isinstance(outcome, Exception):
+            errors[subject] = str(outcome)
+            logger.error(f"Failed to process {subject}: {str(outcome)}")
+        else:
+            results[subject] = outcome
+            logger.info(f"Successfully processed {subject}")
+    
+    logger.info(
+        f"Async processing complete: {len(results)} succeeded, "
+        f"{len(errors)} failed"
+    )
+    
+    if not results and errors:
+        raise AIGenException(
+            f"All subjects failed to process",
+            details={"errors": errors}
+        )
+    
+    return results, errors
+
+
+def _collect_questions(
+    results: Dict[str, List[Dict[str, Any]]],
+    errors: Dict[str, str]
+) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Merge per-subject questions and assign sequential IDs.
+    
+    Args:
+        results: Generated questions by subject
+        errors: Error messages by subject
+        
+    Returns:
+        Tuple of (all_questions, questions_by_subject)
+    """
+    all_questions = []
+    by_subject = {}
+    
+    # Collect and assign IDs; each subject's list is used as-is rather
+    # than copied item by item
+    for subject, questions in results.items():
+        for question_id, question in enumerate(questions, len(all_questions)):
+            question["id"] = question_id
+        by_subject[subject] = questions
+        all_questions.extend(questions)
+    
+    # Add empty lists for failed subjects
+    for subject in errors:
+        by_subject[subject] = []
+    
+    return all_questions, by_subject
+
+
+def _run_subject_task(
+    func: Callable,
+    exam: str,
+    subject_data: Dict[str, Dict[str, Any]],
+    subject: str
+) -> Any:
+    """
+    Call func with one subject's generation arguments.
+    
+    The configuration is read here, inside the task, so a subject with an
+    incomplete configuration fails on its own and is reported in errors
+    instead of aborting the other subjects.
+    
+    Args:
+        func: Subject generation function
+        exam: Exam type
+        subject_data: Dictionary mapping subjects to their configurations
+        subject: Subject to generate
+        
+    Returns:
+        Result of func (a coroutine for async generation functions)
+    """
+    config = subject_data[subject]
+    return func(
+        exam=exam,
+        subject=subject,
+        chapters=config["chapters"],
+        num_questions=config["num_questions"],
+        difficulty=config["difficulty"]
+    )
+
+
 def generate_subjects_parallel(
     exam: str,
     subject_data: Dict[str, Dict[str, Any]],
@@ -99,76 +289,115 @@ def generate_subjects_parallel(
     
     logger.info(f"Generating questions for {len(subject_data)} subjects in parallel")
     
-    all_questions = []
-    by_subject = {}
-    question_id = 0
-    
     # Process each subject
     results, errors = process_subjects_parallel(
-        subjects=list(subject_data.keys()),
-        process_func=lambda subject: _generate_subject_questions(
-            exam=exam,
-            subject=subject,
-            chapters=subject_data[subject]["chapters"],
-            num_questions=subject_data[subject]["num_questions"],
-            difficulty=subject_data[subject]["difficulty"]
-        ),
+        subjects=list(subject_data),
+        process_func=partial(_run_subject_task, _generate_subject_questions, exam, subject_data),
         max_workers=max_workers
     )
     
-    # Collect and assign IDs
-    for subject, questions in results.items():
-        by_subject[subject] = []
-        for question in questions:
-            question["id"] = question_id
-            question_id += 1
-            all_questions.append(question)
-            by_subject[subject].append(question)
+    all_questions, by_subject = _collect_questions(results, errors)
+    logger.info(f"Generated {len(all_questions)} total questions across {len(results)} subjects")
     
-    # Add empty lists for failed subjects
-    for subject in errors:
-        by_subject[subject] = []
+    return all_questions, by_subject
+
+
+async def generate_subjects_parallel_async(
+    exam: str,
+    subject_data: Dict[str, Dict[str, Any]],
+    max_workers: int = 16
+) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Generate questions for multiple subjects concurrently with async LLM calls.
+    
+    Args:
+        exam: Exam type
+        subject_data: Dictionary mapping subjects to their configurations
+        max_workers: Maximum number of subjects generated at once
+        
+    Returns:
+        Tuple of (all_questions, questions_by_subject)
+    """
+    from .question_generator import _agenerate_subject_questions
     
+    logger.info(f"Generating questions for {len(subject_data)} subjects concurrently")
+    
+    results, errors = await process_subjects_parallel_async(
+        subjects=list(subject_data),
+        process_func=partial(_run_subject_task, _agenerate_subject_questions, exam, subject_data),
+        max_workers=max_workers
+    )
+    
+    all_questions, by_subject = _collect_questions(results, errors)
     logger.info(f"Generated {len(all_questions)} total questions across {len(results)} subjects")
     
     return all_questions, by_subject
 
 
+def _collect_batches(
+    completed: Iterator[Tuple[Any, concurrent.futures.Future]],
+    results: List[Any]
+) -> None:
+    """
+    Extend results with each completed batch, logging failed batches.
+    
+    Args:
+        completed: (batch, future) pairs from _run_bounded
+        results: List to extend with batch results
+    """
+    for _, future in completed:
+        try:
+            results.extend(future.result())
+        except Exception as e:
+            logger.error(f"Batch processing error: {str(e)}")
+
+
 def batch_process(
     items: List[Any],
     process_func: Callable,
     batch_size: int = 10,
-    max_workers: int = 3
+    max_workers: int = 3,
+    use_processes: bool = False
 ) -> List[Any]:
     """
     Process items in batches using parallel processing.
     
+    Batches run on the shared thread pool by default, which suits
+    I/O-bound work such as LLM calls. CPU-bound work (parsing, validation,
+    text cleanup) holds the GIL, so use_processes runs the batches on a
+    process pool created for this call instead; process_func and the
+    items must then be picklable (a module-level function, not a lambda).
+    Workers log through their handlers directly (see
+    configure_worker_logging).
+    
     Args:
         items: List of items to process
-        process_func: Function to process each item
+        process_func: Function to process each batch
         batch_size: Number of items per batch
         max_workers: Maximum number of parallel workers
+        use_processes: Run batches in worker processes instead of threads
         
     Returns:
         List of results
     """
-    logger.info(f"Batch processing {len(items)} items (batch_size={batch_size}, workers={max_workers})")
+    logger.info(
+        "Batch processing %d items (batch_size=%d, workers=%d, processes=%s)",
+        len(items), batch_size, max_workers, use_processes
+    )
     
     results = []
     
     # Create batches
     batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
     
-    # Process batches in parallel
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(process_func, batch) for batch in batches]
-        
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                batch_results = future.result()
-                results.extend(batch_results)
-            except Exception as e:
-                logger.error(f"Batch processing error: {str(e)}")
+    if use_processes:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers, initializer=configure_worker_logging
+        ) as executor:
+            _collect_batches(_run_bounded(process_func, batches, max_workers, executor), results)
+    else:
+        # Process batches in parallel on the shared pool
+        _collect_batches(_run_bounded(process_func, batches, max_workers), results)
     
     logger.info(f"Batch processing complete: {len(results)} results")
     return results
@@ -5,9 +5,9 @@ Tracks API calls, generation times, and system metrics.
 
 import time
 import functools
-from typing import Dict, Any, Callable, List
+import threading
+from typing import Dict, Any, Callable, List, Tuple
 from collections import defaultdict
-from threading import Lock
 
 from .logger import get_logger
 
@@ -15,19 +15,94 @@ from .logger import get_logger
 logger = get_logger("performance")
 
 
+class _TimingStats:
+    """
+    Running aggregates for one operation's durations.
+    Updated as samples arrive, so reading stats never walks the samples.
+    """
+    
+    __slots__ = ("count", "total", "min", "max")
+    
+    def __init__(self):
+        """Initialize empty aggregates."""
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+    
+    def add(self, duration: float) -> None:
+        """
+        Fold one sample into the aggregates.
+        
+        Args:
+            duration: Duration in seconds
+        """
+        self.count += 1
+        self.total += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+    
+    def merge(self, other: "_TimingStats") -> None:
+        """
+        Fold another operation's aggregates into these.
+        
+        Args:
+            other: Aggregates to merge
+        """
+        self.count += other.count
+        self.total += other.total
+        if other.min < self.min:
+            self.min = other.min
+        if other.max > self.max:
+            self.max = other.max
+
+
+class _ThreadMetrics:
+    """
+    One thread's private metrics.
+    Only the owning thread writes to it, so recording takes no lock.
+    """
+    
+    __slots__ = ("metrics", "counters")
+    
+    def __init__(self):
+        """Initialize empty metrics."""
+        self.metrics: Dict[str, _TimingStats] = defaultdict(_TimingStats)
+        self.counters: Dict[str, int] = defaultdict(int)
+
+
 class PerformanceMonitor:
     """
     Monitor and track performance metrics.
+    
+    Each thread records into its own _ThreadMetrics, so measured code
+    paths never contend on a shared lock. The lock is only taken to
+    register a thread's buffer and when stats are read or reset, which
+    merges across all buffers. Like LRUCache.get_stats, a read may miss
+    samples that are being recorded at that moment.
     """
     
     def __init__(self):
         """Initialize performance monitor."""
-        self.metrics: Dict[str, List[float]] = defaultdict(list)
-        self.counters: Dict[str, int] = defaultdict(int)
-        self.lock = Lock()
+        self._local = threading.local()
+        self._buffers: List[_ThreadMetrics] = []
+        self.lock = threading.Lock()
         
         logger.info("Performance monitor initialized")
     
+    def _buffer(self) -> _ThreadMetrics:
+        """Get the calling thread's metrics buffer, registering it on first use."""
+        try:
+            return self._local.buffer
+        except AttributeError:
+            buffer = _ThreadMetrics()
+            with self.lock:
+                self._buffers.append(buffer)
+            self._local.buffer = buffer
+            return buffer
+    
     def record_time(self, operation: str, duration: float) -> None:
         """
         Record operation duration.
@@ -36,9 +111,8 @@ class PerformanceMonitor:
             operation: Operation name
             duration: Duration in seconds
         """
-        with self.lock:
-            self.metrics[operation].append(duration)
-            logger.debug(f"Recorded {operation}: {duration:.3f}s")
+        self._buffer().metrics[operation].add(duration)
+        logger.debug("Recorded %s: %.3fs", operation, duration)
     
     def increment_counter(self, counter: str, amount: int = 1) -> None:
         """
@@ -48,8 +122,26 @@ class PerformanceMonitor:
             counter: Counter name
             amount: Amount to increment
         """
+        self._buffer().counters[counter] += amount
+    
+    def _merged(self) -> Tuple[Dict[str, _TimingStats], Dict[str, int]]:
+        """
+        Merge every thread's buffer into one view.
+        
+        Returns:
+            Tuple of (timings by operation, counters)
+        """
+        metrics: Dict[str, _TimingStats] = defaultdict(_TimingStats)
+        counters: Dict[str, int] = defaultdict(int)
         with self.lock:
-            self.counters[counter] += amount
+            for buffer in self._buffers:
+                # Snapshot the items: the owning thread may add keys meanwhile
+                for op, timing in list(buffer.metrics.items()):
+                    if timing.count:
+                        metrics[op].merge(timing)
+                for counter, value in list(buffer.counters.items()):
+                    counters[counter] += value
+        return metrics, counters
     
     def get_stats(self, operation: str = None) -> Dict[str, Any]:
         """
@@ -61,41 +153,48 @@ class PerformanceMonitor:
         Returns:
             Dictionary with performance stats
         """
-        with self.lock:
-            if operation:
-                if operation not in self.metrics:
-                    return {}
-                
-                times = self.metrics[operation]
-                return {
-                    "operation": operation,
-                    "count": len(times),
-                    "total_time": sum(times),
-                    "avg_time": sum(times) / len(times) if times else 0,
-                    "min_time": min(times) if times else 0,
-                    "max_time": max(times) if times else 0
-                }
-            
-            # Return all stats
-            stats = {}
-            for op, times in self.metrics.items():
-                stats[op] = {
-                    "count": len(times),
-                    "total_time": round(sum(times), 3),
-                    "avg_time": round(sum(times) / len(times), 3) if times else 0,
-                    "min_time": round(min(times), 3) if times else 0,
-                    "max_time": round(max(times), 3) if times else 0
-                }
+        metrics, counters = self._merged()
+        
+        if operation:
+            if operation not in metrics:
+                return {}
             
-            stats["counters"] = dict(self.counters)
-            return stats
+            timing = metrics[operation]
+            return {
+                "operation": operation,
+                "count": timing.count,
+                "total_time": timing.total,
+                "avg_time": timing.total / timing.count,
+                "min_time": timing.min,
+                "max_time": timing.max
+            }
+        
+        # Return all stats
+        stats = {}
+        for op, timing in metrics.items():
+            stats[op] = {
+                "count": timing.count,
+                "total_time": round(timing.total, 3),
+                "avg_time": round(timing.total / timing.count, 3),
+                "min_time": round(timing.min, 3),
+                "max_time": round(timing.max, 3)
+            }
+        
+        stats["counters"] = dict(counters)
+        return stats
     
     def reset(self) -> None:
         """Reset all metrics."""
         with self.lock:
-            self.metrics.clear()
-            self.counters.clear()
-            logger.info("Performance metrics reset")
+            for buffer in self._buffers:
+                buffer.metrics.clear()
+                buffer.counters.clear()
+        logger.info("Performance metrics reset")
+
+
+# Report separators
+_REPORT_RULE = "=" * 60
+_REPORT_SEP = "-" * 60
 
 
 # Global performance monitor
@@ -125,13 +224,13 @@ def measure_time(operation_name: str = None):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             monitor = get_monitor()
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             try:
                 result = func(*args, **kwargs)
                 return result
             finally:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 monitor.record_time(op_name, duration)
                 logger.info(f"{op_name} completed in {duration:.3f}s")
         
@@ -170,36 +269,34 @@ def get_performance_report() -> str:
     """
     monitor = get_monitor()
     stats = monitor.get_stats()
+    # get_stats returns a fresh dict, so the counters can be split off
+    # and everything left is an operation timing
+    counters = stats.pop("counters", None)
     
-    report = ["=" * 60]
-    report.append("PERFORMANCE REPORT")
-    report.append("=" * 60)
+    report = [_REPORT_RULE, "PERFORMANCE REPORT", _REPORT_RULE]
     
     # Operation timings
-    if any(k != "counters" for k in stats.keys()):
+    if stats:
         report.append("\nOperation Timings:")
-        report.append("-" * 60)
+        report.append(_REPORT_SEP)
         
         for op, metrics in stats.items():
-            if op == "counters":
-                continue
-            
-            report.append(f"\n{op}:")
-            report.append(f"  Count: {metrics['count']}")
-            report.append(f"  Total Time: {metrics['total_time']:.3f}s")
-            report.append(f"  Avg Time: {metrics['avg_time']:.3f}s")
-            report.append(f"  Min Time: {metrics['min_time']:.3f}s")
-            report.append(f"  Max Time: {metrics['max_time']:.3f}s")
+            report.extend((
+                f"\n{op}:",
+                f"  Count: {metrics['count']}",
+                f"  Total Time: {metrics['total_time']:.3f}s",
+                f"  Avg Time: {metrics['avg_time']:.3f}s",
+                f"  Min Time: {metrics['min_time']:.3f}s",
+                f"  Max Time: {metrics['max_time']:.3f}s"
+            ))
     
     # Counters
-    if "counters" in stats and stats["counters"]:
+    if counters:
         report.append("\nCounters:")
-        report.append("-" * 60)
-        
-        for counter, value in stats["counters"].items():
-            report.append(f"  {counter}: {value}")
+        report.append(_REPORT_SEP)
+        report.extend(f"  {counter}: {value}" for counter, value in counters.items())
     
-    report.append("\n" + "=" * 60)
+    report.append("\n" + _REPORT_RULE)
     
     return "\n".join(report)
 
@@ -213,7 +310,7 @@ def log_performance_summary() -> None:
 # Convenience functions
 def start_timer() -> float:
     """Start a timer and return start time."""
-    return time.time()
+    return time.perf_counter()
 
 
 def end_timer(start_time: float, operation: str = None) -> float:
@@ -227,7 +324,7 @@ def end_timer(start_time: float, operation: str = None) -> float:
     Returns:
         Duration in seconds
     """
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
     
     if operation:
         monitor = get_monitor()
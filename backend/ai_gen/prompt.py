@@ -347,20 +347,21 @@ def get_enhanced_prompt(
     Returns:
         Enhanced prompt string
     """
-    base_prompt = PROMPT_TEMPLATE.format(
+    parts = [PROMPT_TEMPLATE.format(
         exam=exam,
         subject=subject,
         chapters=chapters,
         num_questions=num_questions,
         difficulty=difficulty
-    )
+    )]
     
     # Add difficulty modifier
     if difficulty in DIFFICULTY_MODIFIERS:
-        base_prompt = base_prompt + "\n" + DIFFICULTY_MODIFIERS[difficulty]
+        parts.append(DIFFICULTY_MODIFIERS[difficulty])
     
     # Add subject-specific example if available
     if subject in FEW_SHOT_EXAMPLES:
-        base_prompt = base_prompt + "\n" + FEW_SHOT_EXAMPLES[subject]
+        parts.append(FEW_SHOT_EXAMPLES[subject])
     
-    return base_prompt
+    # Join once instead of concatenating each section onto the prompt
+    return "\n".join(parts)
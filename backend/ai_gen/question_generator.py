@@ -6,7 +6,7 @@ Handles multi-subject generation with validation and error handling.
 import time
 from typing import Dict, List, Any, Tuple
 
-from .llm_service import call_llm
+from .llm_service import call_llm, acall_llm
 from .prompt import PROMPT_TEMPLATE, NUMERICAL_PROMPT_TEMPLATE
 from .question_parser import parse_llm_output
 from .logger import get_logger
@@ -74,8 +74,7 @@ def generate_questions(
     
     all_questions = []
     by_subject = {}
-    question_id = 0
-    total_start_time = time.time()
+    total_start_time = time.perf_counter()
     
 
 
@@ -88,7 +87,7 @@ def generate_questions(
              total_q = data["num_questions"]
              
         logger.info(f"Generating {total_q} questions for {subject}")
-        subject_start_time = time.time()
+        subject_start_time = time.perf_counter()
         
         try:
             # Check if this is JEE mixed type (MCQ + Numerical)
@@ -111,19 +110,17 @@ def generate_questions(
                     difficulty=data["difficulty"]
                 )
             
-            subject_duration = time.time() - subject_start_time
+            subject_duration = time.perf_counter() - subject_start_time
             logger.info(
                 f"Generated {len(questions)} questions for {subject} "
                 f"in {subject_duration:.2f}s"
             )
             
             # Assign IDs and collect questions
-            by_subject[subject] = []
-            for question in questions:
+            for question_id, question in enumerate(questions, len(all_questions)):
                 question["id"] = question_id
-                question_id += 1
-                all_questions.append(question)
-                by_subject[subject].append(question)
+            by_subject[subject] = questions
+            all_questions.extend(questions)
             
             # Check if we got enough questions
             if len(questions) < total_q:
@@ -138,7 +135,7 @@ def generate_questions(
             by_subject[subject] = []
             logger.warning(f"Skipping {subject} due to error")
     
-    total_duration = time.time() - total_start_time
+    total_duration = time.perf_counter() - total_start_time
     logger.info(
         f"Question generation complete: {len(all_questions)} total questions "
         f"in {total_duration:.2f}s"
@@ -154,15 +151,15 @@ def generate_questions(
     return all_questions, by_subject
 
 
-def _generate_subject_questions(
+def _build_subject_prompt(
     exam: str,
     subject: str,
     chapters: List[str],
     num_questions: int,
     difficulty: str
-) -> List[Dict[str, Any]]:
+) -> Tuple[str, int]:
     """
-    Generate questions for a single subject.
+    Build the generation prompt for a single subject.
     
     Args:
         exam: Exam type
@@ -172,10 +169,7 @@ def _generate_subject_questions(
         difficulty: Difficulty level
         
     Returns:
-        List of generated questions
-        
-    Raises:
-        ValidationError: If generation fails
+        Tuple of (prompt, number of questions requested from the LLM)
     """
     # Add buffer to account for validation failures
     # Request more questions than needed, then select the best ones
@@ -194,17 +188,35 @@ def _generate_subject_questions(
     )
     
     logger.debug(f"Prompt length: {len(prompt)} chars")
+    return prompt, questions_to_request
+
+
+def _finish_subject_questions(
+    raw_output: str,
+    subject: str,
+    chapters: List[str],
+    num_questions: int,
+    questions_to_request: int,
+    difficulty: str
+) -> List[Dict[str, Any]]:
+    """
+    Parse an LLM response into the final questions for a subject.
     
-    # Call LLM
-    try:
-        raw_output = call_llm(prompt)
-        logger.debug(f"LLM response length: {len(raw_output)} chars")
-    except Exception as e:
-        logger.error(f"LLM call failed for {subject}: {str(e)}")
-        raise ValidationError(
-            f"Failed to generate questions for {subject}: {str(e)}",
-            field="llm_call"
-        )
+    Args:
+        raw_output: LLM response text
+        subject: Subject name
+        chapters: List of chapters covered
+        num_questions: Number of questions wanted
+        questions_to_request: Number of questions requested from the LLM
+        difficulty: Difficulty level
+        
+    Returns:
+        List of generated questions
+        
+    Raises:
+        ValidationError: If parsing fails
+    """
+    logger.debug(f"LLM response length: {len(raw_output)} chars")
     
     # Parse output
     try:
@@ -239,6 +251,94 @@ def _generate_subject_questions(
     return questions
 
 
+def _generate_subject_questions(
+    exam: str,
+    subject: str,
+    chapters: List[str],
+    num_questions: int,
+    difficulty: str
+) -> List[Dict[str, Any]]:
+    """
+    Generate questions for a single subject.
+    
+    Args:
+        exam: Exam type
+        subject: Subject name
+        chapters: List of chapters to cover
+        num_questions: Number of questions to generate
+        difficulty: Difficulty level
+        
+    Returns:
+        List of generated questions
+        
+    Raises:
+        ValidationError: If generation fails
+    """
+    prompt, questions_to_request = _build_subject_prompt(
+        exam, subject, chapters, num_questions, difficulty
+    )
+    
+    # Call LLM (uncached: a response is only known good after parsing, and
+    # regenerating a paper should produce new questions)
+    try:
+        raw_output = call_llm(prompt, use_cache=False)
+    except Exception as e:
+        logger.error(f"LLM call failed for {subject}: {str(e)}")
+        raise ValidationError(
+            f"Failed to generate questions for {subject}: {str(e)}",
+            field="llm_call"
+        )
+    
+    return _finish_subject_questions(
+        raw_output, subject, chapters, num_questions, questions_to_request, difficulty
+    )
+
+
+async def _agenerate_subject_questions(
+    exam: str,
+    subject: str,
+    chapters: List[str],
+    num_questions: int,
+    difficulty: str
+) -> List[Dict[str, Any]]:
+    """
+    Async variant of _generate_subject_questions.
+    
+    The LLM call awaits the async client, so many subjects can be in
+    flight on one event loop without a thread each.
+    
+    Args:
+        exam: Exam type
+        subject: Subject name
+        chapters: List of chapters to cover
+        num_questions: Number of questions to generate
+        difficulty: Difficulty level
+        
+    Returns:
+        List of generated questions
+        
+    Raises:
+        ValidationError: If generation fails
+    """
+    prompt, questions_to_request = _build_subject_prompt(
+        exam, subject, chapters, num_questions, difficulty
+    )
+    
+    # Call LLM (uncached, see _generate_subject_questions)
+    try:
+        raw_output = await acall_llm(prompt, use_cache=False)
+    except Exception as e:
+        logger.error(f"LLM call failed for {subject}: {str(e)}")
+        raise ValidationError(
+            f"Failed to generate questions for {subject}: {str(e)}",
+            field="llm_call"
+        )
+    
+    return _finish_subject_questions(
+        raw_output, subject, chapters, num_questions, questions_to_request, difficulty
+    )
+
+
 def generate_single_subject(
     exam: str,
     subject: str,
@@ -386,9 +486,9 @@ def _generate_numerical_questions(
     
     logger.debug(f"Numerical prompt length: {len(prompt)} chars")
     
-    # Call LLM
+    # Call LLM (uncached, as for MCQ generation)
     try:
-        raw_output = call_llm(prompt)
+        raw_output = call_llm(prompt, use_cache=False)
         logger.debug(f"LLM response length: {len(raw_output)} chars")
     except Exception as e:
         logger.error(f"LLM call failed for {subject} numericals: {str(e)}")
@@ -8,8 +8,8 @@ from typing import List, Dict, Any, Optional, Tuple
 
 from .logger import get_logger
 from .constants import (
-    QUESTION_PATTERN, ANSWER_PATTERN, SOLUTION_PATTERN,
-    OPTION_PATTERN, MIN_PARSE_SUCCESS_RATE, NUMERICAL_ANSWER_PATTERN
+    QUESTION_RE, ANSWER_RE, SOLUTION_RE,
+    OPTION_RES, MIN_PARSE_SUCCESS_RATE, NUMERICAL_ANSWER_RE
 )
 from .exceptions import ParsingError, InsufficientQuestionsError
 from .validators import validate_question, sanitize_text
@@ -17,6 +17,10 @@ from .validators import validate_question, sanitize_text
 # Initialize logger
 logger = get_logger("question_parser")
 
+# Patterns used by the parsing helpers below
+_QUESTION_NUMBER_RE = re.compile(r'^Q\d+\.?\s*', re.IGNORECASE)
+_FALLBACK_SPLIT_RE = re.compile(r'\n\s*\n+|(?=Q\d+)')
+
 
 def parse_llm_output(
     text: str,
@@ -138,7 +142,7 @@ def _parse_with_regex(text: str, subject: str) -> List[Dict[str, Any]]:
         List of parsed questions
     """
     # Split into question blocks
-    blocks = re.split(QUESTION_PATTERN, text.strip())
+    blocks = QUESTION_RE.split(text.strip())
     blocks = [b.strip() for b in blocks if b.strip()]
     
     questions = []
@@ -167,7 +171,7 @@ def _parse_question_block(block: str, index: int) -> Optional[Dict[str, Any]]:
         Parsed question dictionary or None if parsing fails
     """
     # Extract answer
-    answer_match = re.search(ANSWER_PATTERN, block, re.IGNORECASE)
+    answer_match = ANSWER_RE.search(block)
     numerical_match = None
     question_type = "mcq"
     
@@ -175,7 +179,7 @@ def _parse_question_block(block: str, index: int) -> Optional[Dict[str, Any]]:
         correct_answer = answer_match.group(1).upper()
     else:
         # Check for numerical answer
-        numerical_match = re.search(NUMERICAL_ANSWER_PATTERN, block, re.IGNORECASE)
+        numerical_match = NUMERICAL_ANSWER_RE.search(block)
         if numerical_match:
             try:
                 # Round to nearest integer if decimal, though regex enforces integer-like format
@@ -188,7 +192,7 @@ def _parse_question_block(block: str, index: int) -> Optional[Dict[str, Any]]:
             correct_answer = None
     
     # Extract solution
-    solution_match = re.search(SOLUTION_PATTERN, block, re.IGNORECASE | re.DOTALL)
+    solution_match = SOLUTION_RE.search(block)
     solution = solution_match.group(1).strip() if solution_match else ""
     
     # Remove answer and solution from block to extract question and options
@@ -204,9 +208,8 @@ def _parse_question_block(block: str, index: int) -> Optional[Dict[str, Any]]:
     # Extract options (only for MCQ)
     options = {}
     if question_type == "mcq":
-        for opt in ["A", "B", "C", "D"]:
-            pattern = OPTION_PATTERN.format(opt=opt)
-            match = re.search(pattern, clean_block, re.IGNORECASE)
+        for opt, pattern in OPTION_RES.items():
+            match = pattern.search(clean_block)
             if match:
                 option_text = match.group(1).strip()
                 # Remove this option from the block
@@ -219,8 +222,8 @@ def _parse_question_block(block: str, index: int) -> Optional[Dict[str, Any]]:
     
     for line in lines:
         # Skip lines that look like question numbers
-        if re.match(r'^Q\d+\.?\s*', line, re.IGNORECASE):
-            line = re.sub(r'^Q\d+\.?\s*', '', line, flags=re.IGNORECASE)
+        if _QUESTION_NUMBER_RE.match(line):
+            line = _QUESTION_NUMBER_RE.sub('', line)
         if line and not line.startswith(('Answer:', 'Solution:')):
             question_text = line
             break
@@ -253,7 +256,7 @@ def _parse_with_fallback(text: str, subject: str) -> List[Dict[str, Any]]:
     logger.info("Using fallback parsing strategy")
     
     # Try to split by double newlines or question numbers
-    blocks = re.split(r'\n\s*\n+|(?=Q\d+)', text)
+    blocks = _FALLBACK_SPLIT_RE.split(text)
     blocks = [b.strip() for b in blocks if b.strip() and len(b) > 50]
     
     questions = []
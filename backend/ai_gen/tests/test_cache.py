@@ -0,0 +1,138 @@
+"""
+Unit tests for the caching module.
+Tests key generation, LRU eviction, and TTL expiry.
+"""
+
+import unittest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from ai_gen.cache import LRUCache
+
+
+class TestKeyGeneration(unittest.TestCase):
+    """Test cache key generation."""
+
+    def setUp(self):
+        self.cache = LRUCache(max_size=10, ttl=60)
+
+    def test_key_is_hashable(self):
+        """Test that keys built from nested arguments are hashable."""
+        subject_data = {
+            "Physics": {"chapters": ["Kinematics", "Optics"], "num_questions": 10}
+        }
+        key = self.cache._generate_key("JEE", subject_data)
+        self.assertIsInstance(hash(key), int)
+
+    def test_key_is_order_independent(self):
+        """Test that dict ordering does not change the key."""
+        key1 = self.cache._generate_key({"a": 1, "b": [1, 2]}, x=1, y=2)
+        key2 = self.cache._generate_key({"b": [1, 2], "a": 1}, y=2, x=1)
+        self.assertEqual(key1, key2)
+
+    def test_empty_kwargs_key(self):
+        """Test that the no-kwargs shortcut matches the general key shape."""
+        self.assertEqual(self.cache._generate_key("JEE"), (("JEE",), ()))
+
+    def test_different_arguments_give_different_keys(self):
+        """Test that different arguments produce different keys."""
+        key1 = self.cache._generate_key("JEE", {"Physics": {"num_questions": 10}})
+        key2 = self.cache._generate_key("JEE", {"Physics": {"num_questions": 20}})
+        self.assertNotEqual(key1, key2)
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test LRU cache behaviour."""
+
+    def test_set_and_get(self):
+        """Test storing and retrieving a value."""
+        cache = LRUCache(max_size=10, ttl=60)
+        cache.set("key", "value")
+        self.assertEqual(cache.get("key"), "value")
+        self.assertIsNone(cache.get("missing"))
+
+    def test_stats(self):
+        """Test hit/miss accounting."""
+        cache = LRUCache(max_size=10, ttl=60)
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["size"], 1)
+        self.assertEqual(stats["hit_rate"], 50.0)
+
+    def test_expired_entries_are_misses(self):
+        """Test that entries past their TTL are not returned."""
+        cache = LRUCache(max_size=10, ttl=0.01)
+        cache.set("key", "value")
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("key"))
+
+    def test_remove_expired(self):
+        """Test that only expired entries are swept."""
+        cache = LRUCache(max_size=10, ttl=0.05, num_shards=1)
+        cache.set("old", 1)
+        time.sleep(0.06)
+        cache.set("new", 2)
+
+        self.assertEqual(cache.remove_expired(), 1)
+        self.assertIsNone(cache.get("old"))
+        self.assertEqual(cache.get("new"), 2)
+
+    def test_remove_expired_skips_renewed_keys(self):
+        """Test that re-setting a key extends its lifetime."""
+        cache = LRUCache(max_size=10, ttl=0.05, num_shards=1)
+        cache.set("key", 1)
+        time.sleep(0.03)
+        cache.set("key", 2)
+        time.sleep(0.03)
+
+        self.assertEqual(cache.remove_expired(), 0)
+        self.assertEqual(cache.get("key"), 2)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = LRUCache(max_size=2, ttl=60, num_shards=1)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        cache.get("a")  # "b" and "c" are now least recently used
+        cache.set("d", 4)
+        cache.set("e", 5)  # shard reached 2x capacity, evict down to 2
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNone(cache.get("c"))
+        self.assertEqual(cache.get("d"), 4)
+        self.assertEqual(cache.get("e"), 5)
+
+    def test_small_cache_stays_bounded(self):
+        """Test that a cache smaller than the shard count holds at most 2x max_size."""
+        for max_size in (1, 3, 4, 15):
+            cache = LRUCache(max_size=max_size, ttl=60)
+            for i in range(200):
+                cache.set(f"key{i}", i)
+            self.assertLessEqual(cache.get_stats()["size"], 2 * max_size)
+
+    def test_invalid_shard_count(self):
+        """Test that a non power-of-two shard count is rejected."""
+        with self.assertRaises(ValueError):
+            LRUCache(max_size=10, ttl=60, num_shards=3)
+
+    def test_clear(self):
+        """Test clearing the cache."""
+        cache = LRUCache(max_size=10, ttl=60)
+        cache.set("key", "value")
+        cache.clear()
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.get_stats()["size"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
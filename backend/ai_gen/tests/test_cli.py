@@ -0,0 +1,92 @@
+"""
+Unit tests for the CLI request dispatch.
+Tests serve-mode request handling without spawning a process.
+"""
+
+import unittest
+import sys
+import os
+
+import orjson
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from ai_gen.cli import handle_request, encode_response, parse_argv
+
+
+class TestHandleRequest(unittest.TestCase):
+    """Test line-delimited request handling."""
+
+    def test_health_check_echoes_id(self):
+        """Test that a valid request is answered with its id."""
+        response = handle_request(b'{"id": 7, "command": "health-check"}\n')
+        self.assertTrue(response["success"])
+        self.assertEqual(response["status"], "healthy")
+        self.assertEqual(response["id"], 7)
+
+    def test_unknown_command(self):
+        """Test that unknown commands return an error response."""
+        response = handle_request(b'{"id": "x", "command": "serve"}')
+        self.assertFalse(response["success"])
+        self.assertIn("Unknown command", response["error"])
+        self.assertEqual(response["id"], "x")
+
+    def test_invalid_json(self):
+        """Test that malformed lines do not raise."""
+        response = handle_request(b'not json')
+        self.assertFalse(response["success"])
+        self.assertIn("Invalid JSON request", response["error"])
+
+    def test_handler_errors_are_reported(self):
+        """Test that handler failures become error responses."""
+        response = handle_request(
+            b'{"id": 1, "command": "evaluate", "data": {"questions": []}}'
+        )
+        self.assertFalse(response["success"])
+        self.assertIn("Evaluation failed", response["error"])
+
+    def test_non_string_command(self):
+        """Test that an unhashable command is rejected instead of raising."""
+        response = handle_request(b'{"id": 2, "command": ["x"]}')
+        self.assertFalse(response["success"])
+        self.assertIn("Unknown command", response["error"])
+        self.assertEqual(response["id"], 2)
+
+    def test_unserializable_response(self):
+        """Test that a response orjson cannot encode becomes an error line."""
+        line = encode_response({"id": 3, "success": True, "result": object()})
+        self.assertTrue(line.endswith(b"\n"))
+        response = orjson.loads(line)
+        self.assertFalse(response["success"])
+        self.assertIn("not JSON serializable", response["error"])
+        self.assertEqual(response["id"], 3)
+
+
+class TestParseArgv(unittest.TestCase):
+    """Test the argparse-free fast path."""
+
+    def test_command_without_input(self):
+        """Test commands read from stdin when no path is given."""
+        self.assertEqual(parse_argv(["health-check"]), ("health-check", None))
+        self.assertEqual(parse_argv(["evaluate"]), ("evaluate", None))
+
+    def test_command_with_input_path(self):
+        """Test both option spellings are accepted."""
+        self.assertEqual(
+            parse_argv(["generate-questions", "--config", "c.json"]),
+            ("generate-questions", "c.json")
+        )
+        self.assertEqual(parse_argv(["evaluate", "--data=d.json"]), ("evaluate", "d.json"))
+
+    def test_falls_back_to_argparse(self):
+        """Test help, unknown commands and bad options defer to argparse."""
+        self.assertIsNone(parse_argv([]))
+        self.assertIsNone(parse_argv(["--help"]))
+        self.assertIsNone(parse_argv(["unknown"]))
+        self.assertIsNone(parse_argv(["evaluate", "--help"]))
+        self.assertIsNone(parse_argv(["evaluate", "--config", "c.json"]))
+        self.assertIsNone(parse_argv(["health-check", "--data", "d.json"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Unit tests for the evaluation module.
+Tests scoring, subject breakdowns and percentiles.
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from ai_gen.evaluation import (
+    evaluate, score_submissions, get_performance_insights,
+    calculate_percentile, calculate_percentiles
+)
+
+
+def make_question(q_id, subject, correct):
+    """Build a minimal MCQ question dictionary."""
+    return {
+        "id": q_id,
+        "subject": subject,
+        "question": f"Question {q_id}",
+        "correct": correct,
+        "solution": "Because."
+    }
+
+
+class TestEvaluate(unittest.TestCase):
+    """Test test-attempt scoring."""
+
+    def setUp(self):
+        self.questions = [
+            make_question(1, "Physics", "A"),
+            make_question(2, "Physics", "B"),
+            make_question(3, "Chemistry", "C"),
+            make_question(4, "Chemistry", "D"),
+        ]
+
+    def test_scoring(self):
+        """Test correct, wrong and unattempted answers with JEE marking."""
+        result = evaluate(self.questions, {1: "A", 2: "C", 3: "C"}, "JEE")
+
+        self.assertEqual(result["total_marks"], 7.0)
+        self.assertEqual(result["positive_marks"], 8.0)
+        self.assertEqual(result["negative_marks"], 1.0)
+        self.assertEqual(result["correct"], 2)
+        self.assertEqual(result["wrong"], 1)
+        self.assertEqual(result["unattempted"], 1)
+        self.assertEqual(result["attempted"], 3)
+
+    def test_subject_breakdown(self):
+        """Test per-subject aggregates."""
+        result = evaluate(self.questions, {1: "A", 2: "C", 3: "C"}, "JEE")
+        by_subject = {s["subject"]: s for s in result["subject_results"]}
+
+        self.assertEqual(list(by_subject), ["Physics", "Chemistry"])
+        physics = by_subject["Physics"]
+        self.assertEqual(physics["correct"], 1)
+        self.assertEqual(physics["wrong"], 1)
+        self.assertEqual(physics["marks_obtained"], 3)
+        self.assertEqual(physics["max_marks"], 8)
+        self.assertEqual(physics["accuracy"], 50.0)
+        self.assertEqual(by_subject["Chemistry"]["unattempted"], 1)
+
+    def test_invalid_answer_counts_as_unattempted(self):
+        """Test that answers outside A-D are ignored."""
+        result = evaluate(self.questions, {1: "E"}, "JEE")
+        self.assertEqual(result["unattempted"], 4)
+        self.assertIsNone(result["question_details"][0]["your_answer"])
+
+    def test_question_details(self):
+        """Test per-question detail rows."""
+        result = evaluate(self.questions, {1: "A", 2: "C"}, "JEE")
+        first, second = result["question_details"][:2]
+
+        self.assertTrue(first["is_correct"])
+        self.assertEqual(first["marks_obtained"], 4)
+        self.assertFalse(second["is_correct"])
+        self.assertEqual(second["marks_obtained"], -1)
+        self.assertEqual(second["correct_answer"], "B")
+
+    def test_empty_questions_rejected(self):
+        """Test that an empty question list raises."""
+        from ai_gen.exceptions import ValidationError
+        with self.assertRaises(ValidationError):
+            evaluate([], {}, "JEE")
+
+
+class TestPerformanceInsights(unittest.TestCase):
+    """Test insight generation."""
+
+    def test_insights(self):
+        """Test strengths, weaknesses and recommendations."""
+        questions = [make_question(i, "Physics" if i < 5 else "Chemistry", "A") for i in range(10)]
+        answers = {0: "A", 1: "A", 2: "A", 3: "A", 4: "A", 5: "B", 6: "B"}
+
+        insights = get_performance_insights(evaluate(questions, answers, "JEE"))
+
+        self.assertIn("Strong performance in Physics", insights["strengths"])
+        self.assertIn("Weak performance in Chemistry", insights["weaknesses"])
+        self.assertEqual(len(insights["recommendations"]), 2)
+
+
+class TestScoreSubmissions(unittest.TestCase):
+    """Test bulk scoring."""
+
+    def test_matches_evaluate(self):
+        """Test that bulk scores agree with full evaluations."""
+        questions = [
+            make_question(1, "Physics", "A"),
+            make_question(2, "Chemistry", "B"),
+            make_question(3, "Biology", "C"),
+        ]
+        submissions = [{1: "A", 2: "C"}, {}, {1: "E", 2: "B", 3: "C"}]
+
+        scores = score_submissions(questions, submissions, "UPSC")
+
+        self.assertEqual(len(scores), 3)
+        for score, answers in zip(scores, submissions):
+            full = evaluate(questions, answers, "UPSC")
+            for key in ("total_marks", "attempted", "correct", "wrong", "unattempted", "accuracy"):
+                self.assertEqual(score[key], full[key])
+
+
+class TestPercentile(unittest.TestCase):
+    """Test percentile calculation."""
+
+    def test_percentile(self):
+        """Test the share of scores strictly below the given score."""
+        scores = [10, 20, 30, 40]
+        self.assertEqual(calculate_percentile(30, scores), 50.0)
+        self.assertEqual(calculate_percentile(5, scores), 0.0)
+        self.assertEqual(calculate_percentile(50, scores), 100.0)
+
+    def test_presorted_matches_linear_scan(self):
+        """Test that the bisect path agrees with the linear scan."""
+        scores = [10, 20, 20, 30, 40]
+        for score in (5, 10, 20, 25, 40, 45):
+            self.assertEqual(
+                calculate_percentile(score, scores, presorted=True),
+                calculate_percentile(score, scores)
+            )
+
+    def test_batch_percentiles(self):
+        """Test ranking many scores against an unsorted pool."""
+        pool = [40, 10, 30, 20]
+        self.assertEqual(calculate_percentiles([30, 5, 50], pool), [50.0, 0.0, 100.0])
+        self.assertEqual(calculate_percentiles([1, 2], []), [0.0, 0.0])
+
+    def test_empty_scores(self):
+        """Test that no scores gives a zero percentile."""
+        self.assertEqual(calculate_percentile(10, []), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Unit tests for the exception hierarchy.
+Tests slot-based attributes and pickling.
+"""
+
+import unittest
+import sys
+import os
+import copy
+import pickle
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from ai_gen.exceptions import (
+    AIGenException, RateLimitError, InsufficientQuestionsError
+)
+
+
+class TestExceptions(unittest.TestCase):
+    """Test exception attributes and serialisation."""
+
+    def test_no_instance_dict(self):
+        """Test that declared attributes live in slots."""
+        error = RateLimitError("slow down", retry_after=5)
+        self.assertEqual(error.retry_after, 5)
+        self.assertEqual(error.details, {"retry_after": 5})
+        self.assertEqual(error.__dict__, {})
+
+    def test_pickle_round_trip(self):
+        """Test that slot values survive pickling and copying."""
+        error = InsufficientQuestionsError(10, 7, subject="Physics")
+        for restored in (pickle.loads(pickle.dumps(error)), copy.copy(error)):
+            self.assertIsInstance(restored, AIGenException)
+            self.assertEqual(restored.generated, 7)
+            self.assertEqual(restored.subject, "Physics")
+            self.assertEqual(str(restored), str(error))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,294 @@
+"""
+Unit tests for the LLM service.
+Tests retry handling and concurrent batching against an in-memory client.
+"""
+
+import unittest
+import asyncio
+import threading
+import sys
+import os
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import httpx
+from google.genai import errors as genai_errors
+
+from ai_gen import llm_service
+from ai_gen.llm_service import LLMService, _compute_backoff, _classify_error, call_llm, call_llm_batch
+from ai_gen.cache import clear_all_caches
+from ai_gen.constants import MAX_RETRY_DELAY, RETRY_JITTER, CIRCUIT_BREAKER_THRESHOLD
+from ai_gen.exceptions import LLMServiceError, RateLimitError, APIError
+
+
+class FakeModels:
+    """Client models API that replays scripted results per prompt."""
+
+    def __init__(self, script):
+        self.script = script
+        self.calls = []
+
+    def generate_content(self, model, contents, config):
+        self.calls.append(contents)
+        outcome = self.script[contents].pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return SimpleNamespace(text=outcome)
+
+    def generate_content_stream(self, model, contents, config):
+        self.calls.append(contents)
+        for outcome in self.script[contents].pop(0):
+            if isinstance(outcome, Exception):
+                raise outcome
+            yield SimpleNamespace(text=outcome)
+
+
+class FakeAsyncModels:
+    """Async wrapper around FakeModels whose pool, like httpx's, belongs to one loop."""
+
+    def __init__(self, models):
+        self.models = models
+        self.pool_loop = None
+
+    async def generate_content(self, model, contents, config):
+        if self.pool_loop is None:
+            self.pool_loop = asyncio.get_running_loop()
+        elif self.pool_loop.is_closed():
+            raise RuntimeError("Event loop is closed")
+        await asyncio.sleep(0)
+        return self.models.generate_content(model, contents, config)
+
+
+def make_service(script):
+    """Build an LLMService wired to a fake client, skipping Vertex AI setup."""
+    clear_all_caches()
+    models = FakeModels(script)
+    service = LLMService.__new__(LLMService)
+    service.model = "test-model"
+    service.temperature = 0.4
+    service.location = "test"
+    service._closing = threading.Event()
+    service._cb_lock = threading.Lock()
+    service._cb_failures = 0
+    service._cb_open_until = 0.0
+    service._loop = None
+    service._loop_lock = threading.Lock()
+    service.client = SimpleNamespace(
+        models=models,
+        aio=SimpleNamespace(models=FakeAsyncModels(models))
+    )
+    return service, models
+
+
+class TestBackoff(unittest.TestCase):
+    """Test retry backoff computation."""
+
+    def test_exponential_with_bounded_jitter(self):
+        """Test that delays grow exponentially within the jitter band."""
+        for attempt in range(4):
+            delay = _compute_backoff(attempt, 1.0)
+            self.assertGreaterEqual(delay, 2 ** attempt)
+            self.assertLessEqual(delay, 2 ** attempt * (1 + RETRY_JITTER))
+
+    def test_capped(self):
+        """Test that delays never exceed the cap."""
+        self.assertEqual(_compute_backoff(20, 1.0), MAX_RETRY_DELAY)
+
+
+class TestClassifyError(unittest.TestCase):
+    """Test failure classification."""
+
+    def test_typed_errors_use_status_code(self):
+        """Test that provider errors are classified by status, not text."""
+        rate_limited = genai_errors.ClientError(429, {"error": {"message": "slow down"}})
+        timed_out = genai_errors.ServerError(504, {"error": {"message": "deadline"}})
+        bad_request = genai_errors.ClientError(400, {"error": {"message": "quota field invalid"}})
+
+        self.assertEqual(_classify_error(rate_limited), "rate_limit")
+        self.assertEqual(_classify_error(timed_out), "timeout")
+        self.assertEqual(_classify_error(bad_request), "not_retryable")
+        self.assertEqual(_classify_error(genai_errors.ServerError(500, {})), "generic")
+
+    def test_untyped_errors_fall_back_to_message(self):
+        """Test message matching for errors without a status code."""
+        self.assertEqual(_classify_error(Exception("Rate limit reached")), "rate_limit")
+        self.assertEqual(_classify_error(Exception("RESOURCE_EXHAUSTED")), "rate_limit")
+        self.assertEqual(_classify_error(Exception("Gateway Timeout")), "timeout")
+        self.assertEqual(_classify_error(TimeoutError()), "timeout")
+        self.assertEqual(_classify_error(ValueError("boom")), "generic")
+
+
+class TestCall(unittest.TestCase):
+    """Test synchronous calls."""
+
+    def test_retries_then_succeeds(self):
+        """Test that transient failures are retried."""
+        service, models = make_service({"p": [Exception("boom"), "ok"]})
+        self.assertEqual(service.call("p", max_retries=3, retry_delay=0), "ok")
+        self.assertEqual(len(models.calls), 2)
+
+    def test_gives_up_with_typed_error(self):
+        """Test that the last failure is raised as a typed error."""
+        service, _ = make_service({"p": [Exception("429 quota"), Exception("429 quota")]})
+        with self.assertRaises(RateLimitError):
+            service.call("p", max_retries=2, retry_delay=0)
+
+    def test_rate_limit_honours_requested_wait(self):
+        """Test that a 'retry in Ns' hint sets the backoff."""
+        service, _ = make_service({})
+        error = Exception("429 RESOURCE_EXHAUSTED: please retry in 2.5s")
+        self.assertEqual(service._handle_failure(error, 0, 3, 0), 3.5)
+
+    def test_retry_after_header(self):
+        """Test that a typed rate limit uses the Retry-After header."""
+        service, _ = make_service({})
+        response = httpx.Response(429, headers={"Retry-After": "4"})
+        error = genai_errors.ClientError(429, {"error": {"message": "slow down"}}, response)
+        self.assertEqual(service._handle_failure(error, 0, 3, 0), 5.0)
+
+    def test_client_error_is_not_retried(self):
+        """Test that a rejected request fails on the first attempt."""
+        error = genai_errors.ClientError(400, {"error": {"message": "bad prompt", "status": "INVALID_ARGUMENT"}})
+        service, models = make_service({"p": [error, "ok"]})
+        with self.assertRaises(APIError) as ctx:
+            service.call("p", max_retries=3, retry_delay=0)
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.assertEqual(len(models.calls), 1)
+
+    def test_empty_response_is_retried(self):
+        """Test that an empty response counts as a failed attempt."""
+        service, _ = make_service({"p": ["", "ok"]})
+        self.assertEqual(service.call("p", max_retries=2, retry_delay=0), "ok")
+
+    def test_close_interrupts_backoff(self):
+        """Test that closing the service wakes a caller waiting to retry."""
+        service, models = make_service({"p": [Exception("boom"), "ok"]})
+        threading.Timer(0.05, service._closing.set).start()
+        with self.assertRaises(LLMServiceError):
+            service.call("p", max_retries=2, retry_delay=10)
+        self.assertEqual(len(models.calls), 1)
+
+
+class TestStream(unittest.TestCase):
+    """Test streamed responses."""
+
+    def test_stream_yields_chunks(self):
+        """Test chunks arrive in order and failures before output are retried."""
+        service, models = make_service({"p": [[Exception("boom")], ["Q1. ", "", "Q2."]]})
+        chunks = list(service.stream("p", max_retries=2, retry_delay=0))
+        self.assertEqual(chunks, ["Q1. ", "Q2."])
+        self.assertEqual(len(models.calls), 2)
+
+    def test_interrupted_stream_raises(self):
+        """Test a failure after partial output is not retried."""
+        service, models = make_service({"p": [["Q1. ", Exception("reset")], ["Q1. Q2."]]})
+        with self.assertRaises(LLMServiceError):
+            list(service.stream("p", max_retries=2, retry_delay=0))
+        self.assertEqual(len(models.calls), 1)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test fail-fast behaviour after repeated failures."""
+
+    def test_opens_after_threshold_and_recovers(self):
+        """Test the circuit opens, skips the client, then closes on success."""
+        service, models = make_service({"p": [Exception("boom"), "ok"]})
+        service._cb_failures = CIRCUIT_BREAKER_THRESHOLD - 1
+        with self.assertRaises(LLMServiceError):
+            service.call("p", max_retries=1, retry_delay=0)
+        self.assertEqual(service.health()["circuit"], "open")
+
+        with self.assertRaises(LLMServiceError):
+            service.call("p", max_retries=1, retry_delay=0)
+        self.assertEqual(len(models.calls), 1)
+
+        service._cb_open_until = 0.0  # cooldown elapsed
+        self.assertEqual(service.call("p", max_retries=1, retry_delay=0), "ok")
+        self.assertEqual(service.health(), {
+            "circuit": "closed", "consecutive_failures": 0, "retry_after": 0.0
+        })
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test caching of identical prompts."""
+
+    def test_identical_prompt_is_served_from_cache(self):
+        """Test that a repeated prompt does not hit the client again."""
+        service, models = make_service({"p": ["first", "second"]})
+        self.assertEqual(service.call("p", retry_delay=0), "first")
+        self.assertEqual(service.call("p", retry_delay=0), "first")
+        self.assertEqual(asyncio.run(service.acall("p", retry_delay=0)), "first")
+        self.assertEqual(len(models.calls), 1)
+
+    def test_cache_can_be_bypassed(self):
+        """Test use_cache=False and high temperatures skip the cache."""
+        service, models = make_service({"p": ["first", "second", "third"]})
+        service.call("p", retry_delay=0)
+        self.assertEqual(service.call("p", retry_delay=0, use_cache=False), "second")
+
+        service.temperature = 0.9
+        self.assertEqual(service.call("p", retry_delay=0), "third")
+
+    def test_call_llm_can_bypass_cache(self):
+        """Test the convenience wrapper passes use_cache through (generation uses it)."""
+        service, models = make_service({"p": ["first", "second"]})
+        previous, llm_service._llm_service = llm_service._llm_service, service
+        try:
+            self.assertEqual(call_llm("p", use_cache=False), "first")
+            self.assertEqual(call_llm("p", use_cache=False), "second")
+        finally:
+            llm_service._llm_service = previous
+        self.assertEqual(len(models.calls), 2)
+
+
+class TestAsyncCall(unittest.TestCase):
+    """Test asynchronous calls and batching."""
+
+    def test_acall(self):
+        """Test an async call with a retry."""
+        service, _ = make_service({"p": [Exception("timeout"), "ok"]})
+        result = asyncio.run(service.acall("p", max_retries=2, retry_delay=0))
+        self.assertEqual(result, "ok")
+
+    def test_abatch_keeps_order_and_isolates_failures(self):
+        """Test that one failing prompt does not affect the others."""
+        service, _ = make_service({
+            "a": ["A"],
+            "b": [Exception("bad request")],
+            "c": ["C"],
+        })
+
+        async def run():
+            prompts = ["a", "b", "c"]
+            return await asyncio.gather(
+                *(service.acall(p, max_retries=1, retry_delay=0) for p in prompts),
+                return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        self.assertEqual(results[0], "A")
+        self.assertIsInstance(results[1], LLMServiceError)
+        self.assertEqual(results[2], "C")
+
+    def test_abatch(self):
+        """Test the batch helper."""
+        service, _ = make_service({"a": ["A"], "b": ["B"]})
+        self.assertEqual(asyncio.run(service.abatch(["a", "b"])), ["A", "B"])
+
+    def test_repeated_sync_batches_reuse_the_async_pool(self):
+        """Test a second call_llm_batch does not hit a pool tied to a closed loop."""
+        service, _ = make_service({"a": ["A1", "A2", "A3"], "b": ["B1", "B2"]})
+        previous, llm_service._llm_service = llm_service._llm_service, service
+        try:
+            self.assertEqual(call_llm_batch(["a", "b"]), ["A1", "B1"])
+            clear_all_caches()
+            self.assertEqual(call_llm_batch(["a", "b"]), ["A2", "B2"])
+            self.assertEqual(asyncio.run(service.acall("a", retry_delay=0, use_cache=False)), "A3")
+        finally:
+            llm_service._llm_service = previous
+            service._loop.call_soon_threadsafe(service._loop.stop)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,9 @@ Tests model creation, validation, and serialization.
 import unittest
 import sys
 import os
+from dataclasses import asdict
+
+import orjson
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
@@ -168,6 +171,24 @@ class TestExamConfig(unittest.TestCase):
         )
         
         self.assertEqual(config.get_total_questions(), 25)
+    
+    def test_exam_config_to_dict(self):
+        """Test that enums and nested configs are converted."""
+        config = ExamConfig(
+            exam_type=ExamType.JEE,
+            subjects=[SubjectConfig("Physics", ["Kinematics"], 10, "Medium")]
+        )
+        
+        self.assertEqual(config.to_dict(), {
+            "exam_type": "JEE",
+            "subjects": [{
+                "subject": "Physics",
+                "chapters": ["Kinematics"],
+                "num_questions": 10,
+                "difficulty": "Medium"
+            }],
+            "total_duration": 180
+        })
 
 
 class TestQuestionAttempt(unittest.TestCase):
@@ -229,6 +250,19 @@ class TestSubjectResult(unittest.TestCase):
         
         self.assertEqual(result.accuracy, 0.0)
 
+    def test_subject_result_serialization_includes_accuracy(self):
+        """Test accuracy is emitted by to_dict, asdict and orjson alike."""
+        result = SubjectResult("Physics", 10, 8, 6, 2, 2, 22.0, 40.0)
+        expected = {
+            "subject": "Physics", "total_questions": 10, "attempted": 8,
+            "correct": 6, "wrong": 2, "unattempted": 2,
+            "marks_obtained": 22.0, "max_marks": 40.0, "accuracy": 75.0
+        }
+        
+        self.assertEqual(result.to_dict(), expected)
+        self.assertEqual(asdict(result), expected)
+        self.assertEqual(orjson.loads(orjson.dumps(result)), expected)
+
 
 class TestMarkingScheme(unittest.TestCase):
     """Test MarkingScheme model."""
@@ -0,0 +1,172 @@
+"""
+Unit tests for the parallel processing utilities.
+Tests result collection and per-call concurrency limits on the shared pool.
+"""
+
+import unittest
+import sys
+import os
+import time
+import asyncio
+import threading
+import logging
+import tempfile
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from ai_gen.parallel import (
+    process_subjects_parallel, process_subjects_parallel_async, batch_process,
+    generate_subjects_parallel, generate_subjects_parallel_async, _collect_questions
+)
+from ai_gen.exceptions import AIGenException
+from ai_gen.logger import get_logger, _listeners
+
+
+def double_batch(batch):
+    """Module-level batch function, so it can be sent to worker processes."""
+    return [x * 2 for x in batch]
+
+
+def logging_batch(batch):
+    """Batch function that logs from the worker process."""
+    get_logger("tests").warning(f"worker batch from pid {os.getpid()}")
+    return batch
+
+
+class TestProcessSubjectsParallel(unittest.TestCase):
+    """Test parallel subject processing."""
+
+    def test_results_errors_and_worker_cap(self):
+        """Test that failures are collected and max_workers is respected."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def process(subject, suffix):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            if subject == "Botany":
+                raise ValueError("boom")
+            return subject + suffix
+
+        results, errors = process_subjects_parallel(
+            ["Physics", "Chemistry", "Botany", "Zoology"], process, max_workers=2, suffix="!"
+        )
+
+        self.assertEqual(results, {"Physics": "Physics!", "Chemistry": "Chemistry!", "Zoology": "Zoology!"})
+        self.assertEqual(errors, {"Botany": "boom"})
+        self.assertLessEqual(state["peak"], 2)
+
+    def test_all_failed_raises(self):
+        """Test that an exception is raised when every subject fails."""
+        def process(subject):
+            raise ValueError("boom")
+
+        with self.assertRaises(AIGenException):
+            process_subjects_parallel(["Physics"], process)
+
+    def test_batch_process(self):
+        """Test that every batch result is collected."""
+        results = batch_process(list(range(7)), lambda batch: [x * 2 for x in batch], batch_size=3)
+        self.assertEqual(sorted(results), [0, 2, 4, 6, 8, 10, 12])
+
+    def test_batch_process_in_processes(self):
+        """Test batches run on a process pool when requested."""
+        results = batch_process(list(range(7)), double_batch, batch_size=3, max_workers=2, use_processes=True)
+        self.assertEqual(sorted(results), [0, 2, 4, 6, 8, 10, 12])
+
+    def test_process_workers_emit_log_records(self):
+        """Test records logged in worker processes reach the handlers."""
+        with tempfile.NamedTemporaryFile(mode="r", suffix=".log") as log_file:
+            handler = logging.FileHandler(log_file.name)
+            handler.setLevel(logging.WARNING)
+            listener = _listeners["ai_gen"]
+            listener.handlers += (handler,)
+            try:
+                batch_process([1, 2], logging_batch, batch_size=1, max_workers=1, use_processes=True)
+            finally:
+                listener.handlers = tuple(h for h in listener.handlers if h is not handler)
+                handler.close()
+            logged = log_file.read()
+
+        self.assertIn("worker batch from pid", logged)
+        self.assertNotIn(f"pid {os.getpid()}", logged)
+
+
+class TestCollectQuestions(unittest.TestCase):
+    """Test merging of per-subject questions."""
+
+    def test_sequential_ids(self):
+        """Test IDs run across subjects and failed subjects get empty lists."""
+        results = {"Physics": [{}, {}], "Chemistry": [{}]}
+        all_questions, by_subject = _collect_questions(results, {"Biology": "boom"})
+
+        self.assertEqual([q["id"] for q in all_questions], [0, 1, 2])
+        self.assertEqual([q["id"] for q in by_subject["Chemistry"]], [2])
+        self.assertEqual(by_subject["Biology"], [])
+
+class TestGenerateSubjectsParallel(unittest.TestCase):
+    """Test multi-subject generation."""
+
+    subject_data = {
+        "Physics": {"chapters": ["Kinematics"], "num_questions": 2, "difficulty": "Easy"},
+        "Chemistry": {"chapters": ["Mole Concept"], "num_questions": 1},
+    }
+
+    @staticmethod
+    def fake_generate(exam, subject, chapters, num_questions, difficulty):
+        return [{"subject": subject, "chapter": chapters[0]} for _ in range(num_questions)]
+
+    def test_incomplete_config_fails_only_that_subject(self):
+        """Test a subject missing config keys is reported without stopping the rest."""
+        with mock.patch("ai_gen.question_generator._generate_subject_questions", self.fake_generate):
+            all_questions, by_subject = generate_subjects_parallel("JEE", self.subject_data)
+
+        self.assertEqual([q["id"] for q in all_questions], [0, 1])
+        self.assertEqual(len(by_subject["Physics"]), 2)
+        self.assertEqual(by_subject["Chemistry"], [])
+
+    def test_async_incomplete_config_fails_only_that_subject(self):
+        """Test the async variant isolates a subject's config error too."""
+        async def fake_agenerate(**kwargs):
+            return self.fake_generate(**kwargs)
+
+        with mock.patch("ai_gen.question_generator._agenerate_subject_questions", fake_agenerate):
+            all_questions, by_subject = asyncio.run(
+                generate_subjects_parallel_async("JEE", self.subject_data)
+            )
+
+        self.assertEqual(len(all_questions), 2)
+        self.assertEqual(by_subject["Chemistry"], [])
+
+
+class TestProcessSubjectsParallelAsync(unittest.TestCase):
+    """Test async subject processing."""
+
+    def test_results_errors_and_limit(self):
+        """Test that failures are collected and the concurrency limit holds."""
+        state = {"active": 0, "peak": 0}
+
+        async def process(subject):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            if subject == "Botany":
+                raise ValueError("boom")
+            return subject.lower()
+
+        results, errors = asyncio.run(process_subjects_parallel_async(
+            ["Physics", "Chemistry", "Botany"], process, max_workers=2
+        ))
+
+        self.assertEqual(results, {"Physics": "physics", "Chemistry": "chemistry"})
+        self.assertEqual(errors, {"Botany": "boom"})
+        self.assertEqual(state["peak"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Unit tests for PDF generation.
+Tests that question papers and answer keys render across pages.
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from reportlab.pdfgen import canvas
+from reportlab.lib.utils import simpleSplit
+
+from ai_gen.pdf_utils import (
+    generate_question_pdf, generate_answer_pdf, generate_both_pdfs, _PageWriter, _wrap, _clean_latex,
+    get_wrap_cache_stats
+)
+from ai_gen.constants import PDF_MARGIN_BOTTOM, PDF_FONT_BODY, PDF_FONT_SIZE_BODY
+
+
+def sample_questions(count=30):
+    """Build a questions_by_subject mapping long enough to span pages."""
+    question = {
+        "question": "A block of mass $m$ slides down a rough incline of angle \\theta. " * 3,
+        "options": {"A": "g \\sin\\theta", "B": "g \\cos\\theta", "C": "\\frac{g}{2}", "D": "zero"},
+        "correct": "A",
+        "solution": "Resolve forces along the incline and apply Newton's second law. " * 2
+    }
+    return {"Physics": [dict(question) for _ in range(count)]}
+
+
+class TestPDFGeneration(unittest.TestCase):
+    """Test question paper and answer key generation."""
+
+    def test_question_pdf(self):
+        """Test that the question paper is a multi-page PDF."""
+        data = generate_question_pdf(sample_questions()).getvalue()
+        self.assertTrue(data.startswith(b"%PDF"))
+        self.assertGreater(data.count(b"/Type /Page\n"), 1)
+
+    def test_answer_pdf(self):
+        """Test that the answer key is a multi-page PDF."""
+        data = generate_answer_pdf(sample_questions()).getvalue()
+        self.assertTrue(data.startswith(b"%PDF"))
+        self.assertGreater(data.count(b"/Type /Page\n"), 1)
+
+    def test_both_pdfs(self):
+        """Test that the one-pass generator matches the separate ones page for page."""
+        questions = sample_questions()
+        paper, key = generate_both_pdfs(questions)
+        self.assertEqual(
+            paper.getvalue().count(b"/Type /Page\n"),
+            generate_question_pdf(questions).getvalue().count(b"/Type /Page\n")
+        )
+        self.assertEqual(
+            key.getvalue().count(b"/Type /Page\n"),
+            generate_answer_pdf(questions).getvalue().count(b"/Type /Page\n")
+        )
+
+
+class TestPageWriter(unittest.TestCase):
+    """Test page-break handling."""
+
+    def test_block_is_split_at_bottom_margin(self):
+        """Test that lines that do not fit continue at the top of the next page."""
+        c = canvas.Canvas(os.devnull)
+        writer = _PageWriter(c, 800)
+        writer.y = PDF_MARGIN_BOTTOM + 30
+        writer.write_lines([f"line {i}" for i in range(10)], 50, PDF_FONT_BODY, PDF_FONT_SIZE_BODY, 20)
+
+        self.assertEqual(c.getPageNumber(), 2)
+        self.assertEqual(writer.y, writer.top - 8 * 20)
+
+
+class TestWrap(unittest.TestCase):
+    """Test line wrapping."""
+
+    def test_matches_simple_split(self):
+        """Test that the width-table path wraps exactly like simpleSplit."""
+        texts = [
+            "   A) " + "Resolve forces along the incline (mu = 0.25). " * 6,
+            "first line\nsecond   line with\tspaces",
+            "Unicode falls back: \u03b8 \u2264 \u03c0 " * 10,
+            "",
+        ]
+        for text in texts:
+            for width in (495, 60):
+                self.assertEqual(
+                    _wrap(text, PDF_FONT_BODY, PDF_FONT_SIZE_BODY, width),
+                    tuple(simpleSplit(text, PDF_FONT_BODY, PDF_FONT_SIZE_BODY, width))
+                )
+
+    def test_repeated_text_hits_cache(self):
+        """Test that wrapping the same text again is served from the cache."""
+        _wrap.cache_clear()
+        generate_answer_pdf(sample_questions(count=3))
+        stats = get_wrap_cache_stats()
+        self.assertGreater(stats["hits"], 0)
+        self.assertLess(stats["size"], stats["total_requests"])
+
+
+class TestCleanLatex(unittest.TestCase):
+    """Test LaTeX to plain-text conversion."""
+
+    def test_symbols_and_structure(self):
+        """Test symbols, fractions, scripts and delimiters are converted."""
+        self.assertEqual(
+            _clean_latex(r"$F = \frac{1}{2}mv^{2}$, $\theta \leq \pi$ and H_2O"),
+            "F = (1)/(2)mv², θ ≤ π and H₂O"
+        )
+
+    def test_whole_commands_only(self):
+        """Test that a command is never replaced by a shorter command's symbol."""
+        self.assertEqual(_clean_latex(r"\neg p, A \subseteq B, x \notin S"), "¬ p, A ⊆ B, x ∉ S")
+
+    def test_plain_text_unchanged(self):
+        """Test that text without LaTeX markers is returned as is."""
+        text = "Velocity is 20 m/s [approx.] (north-east)"
+        self.assertIs(_clean_latex(text), text)
+        self.assertEqual(_clean_latex("**Note:** see (a)"), "Note: see (a)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Unit tests for the performance monitor.
+Tests timing aggregates, counters, and the text report.
+"""
+
+import unittest
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from ai_gen.performance import PerformanceMonitor
+
+
+class TestPerformanceMonitor(unittest.TestCase):
+    """Test metric recording and statistics."""
+
+    def test_timing_stats(self):
+        """Test that aggregates match the recorded samples."""
+        monitor = PerformanceMonitor()
+        for duration in (0.5, 0.25, 1.0):
+            monitor.record_time("generate", duration)
+
+        self.assertEqual(monitor.get_stats("generate"), {
+            "operation": "generate",
+            "count": 3,
+            "total_time": 1.75,
+            "avg_time": 1.75 / 3,
+            "min_time": 0.25,
+            "max_time": 1.0
+        })
+        self.assertEqual(monitor.get_stats("missing"), {})
+
+    def test_all_stats_and_reset(self):
+        """Test the combined view with counters, and that reset clears both."""
+        monitor = PerformanceMonitor()
+        monitor.record_time("parse", 0.1234)
+        monitor.increment_counter("api_calls", 2)
+
+        stats = monitor.get_stats()
+        self.assertEqual(stats["parse"]["total_time"], 0.123)
+        self.assertEqual(stats["counters"], {"api_calls": 2})
+
+        monitor.reset()
+        self.assertEqual(monitor.get_stats(), {"counters": {}})
+
+    def test_records_from_many_threads(self):
+        """Test that per-thread buffers are merged into one view."""
+        monitor = PerformanceMonitor()
+
+        def work():
+            for _ in range(100):
+                monitor.record_time("call", 0.01)
+                monitor.increment_counter("calls")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = monitor.get_stats()
+        self.assertEqual(stats["call"]["count"], 400)
+        self.assertEqual(stats["counters"], {"calls": 400})
+
+
+if __name__ == '__main__':
+    unittest.main()
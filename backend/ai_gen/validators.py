@@ -3,9 +3,12 @@ Validation functions for the AI generation module.
 Provides comprehensive validation for questions, configurations, and user inputs.
 """
 
+import sys
 from typing import Dict, List, Any, Optional, Tuple
 from .constants import (
     VALID_EXAMS, VALID_DIFFICULTIES, VALID_OPTIONS,
+    VALID_EXAMS_SET, VALID_DIFFICULTIES_SET, VALID_OPTIONS_SET,
+    VALID_EXAMS_STR, VALID_DIFFICULTIES_STR,
     MIN_QUESTIONS_PER_SUBJECT, MAX_QUESTIONS_PER_SUBJECT,
     MIN_QUESTION_LENGTH, MAX_QUESTION_LENGTH,
     MIN_OPTION_LENGTH, MAX_OPTION_LENGTH,
@@ -17,7 +20,7 @@ from .exceptions import (
     InvalidExamTypeError, InvalidSubjectError,
     InvalidDifficultyError
 )
-from .exam_config import SYLLABUS
+from .exam_config import SYLLABUS, get_chapter_set
 
 
 def validate_exam_type(exam: str) -> None:
@@ -30,8 +33,8 @@ def validate_exam_type(exam: str) -> None:
     Raises:
         InvalidExamTypeError: If exam type is invalid
     """
-    if exam not in VALID_EXAMS:
-        raise InvalidExamTypeError(exam, list(VALID_EXAMS))
+    if not isinstance(exam, str) or exam not in VALID_EXAMS_SET:
+        raise InvalidExamTypeError(exam, VALID_EXAMS, VALID_EXAMS_STR)
 
 
 def validate_subject(exam: str, subject: str) -> None:
@@ -46,9 +49,9 @@ def validate_subject(exam: str, subject: str) -> None:
         InvalidSubjectError: If subject is invalid for the exam
     """
     validate_exam_type(exam)
-    valid_subjects = list(SYLLABUS.get(exam, {}).keys())
-    if subject not in valid_subjects:
-        raise InvalidSubjectError(subject, exam, valid_subjects)
+    exam_syllabus = SYLLABUS.get(exam, {})
+    if not isinstance(subject, str) or subject not in exam_syllabus:
+        raise InvalidSubjectError(subject, exam, list(exam_syllabus))
 
 
 def validate_difficulty(difficulty: str) -> None:
@@ -61,8 +64,8 @@ def validate_difficulty(difficulty: str) -> None:
     Raises:
         InvalidDifficultyError: If difficulty is invalid
     """
-    if difficulty not in VALID_DIFFICULTIES:
-        raise InvalidDifficultyError(difficulty, list(VALID_DIFFICULTIES))
+    if not isinstance(difficulty, str) or difficulty not in VALID_DIFFICULTIES_SET:
+        raise InvalidDifficultyError(difficulty, VALID_DIFFICULTIES, VALID_DIFFICULTIES_STR)
 
 
 def validate_num_questions(num_questions: int) -> None:
@@ -119,10 +122,11 @@ def validate_chapters(exam: str, subject: str, chapters: List[str]) -> None:
             value=chapters
         )
     
-    valid_chapters = SYLLABUS.get(exam, {}).get(subject, [])
-    invalid_chapters = [ch for ch in chapters if ch not in valid_chapters]
+    valid_chapter_set = get_chapter_set(exam, subject)
+    invalid_chapters = [ch for ch in chapters if ch not in valid_chapter_set]
     
     if invalid_chapters:
+        valid_chapters = SYLLABUS.get(exam, {}).get(subject, [])
         raise ValidationError(
             f"Invalid chapters for {exam} {subject}: {', '.join(invalid_chapters)}. "
             f"Valid chapters: {', '.join(valid_chapters)}",
@@ -177,7 +181,7 @@ def validate_question_structure(question: Dict[str, Any]) -> Tuple[bool, List[st
             
             # Validate each option
             for opt_key, opt_text in options.items():
-                if opt_key not in VALID_OPTIONS:
+                if opt_key not in VALID_OPTIONS_SET:
                     errors.append(f"Invalid option key: {opt_key}")
                 if not isinstance(opt_text, str):
                     errors.append(f"Option {opt_key} must be a string")
@@ -197,7 +201,7 @@ def validate_question_structure(question: Dict[str, Any]) -> Tuple[bool, List[st
                  errors.append(f"Numerical answer string must be integer, got {correct}")
         else:
             # For MCQ
-            if correct not in VALID_OPTIONS:
+            if not isinstance(correct, str) or correct not in VALID_OPTIONS_SET:
                 errors.append(f"Invalid correct answer: {correct}. Must be one of {VALID_OPTIONS}")
     
     # Validate solution
@@ -287,7 +291,7 @@ def validate_user_answer(answer: Optional[str]) -> bool:
     """
     if answer is None:
         return True  # Unattempted is valid
-    return answer in VALID_OPTIONS
+    return isinstance(answer, str) and answer in VALID_OPTIONS_SET
 
 
 def validate_subject_config(exam: str, subject_data: Dict[str, Any]) -> None:
@@ -334,3 +338,21 @@ def sanitize_text(text: str, max_length: Optional[int] = None) -> str:
         text = text[:max_length].rsplit(' ', 1)[0] + "..."
     
     return text.strip()
+
+
+def intern_str(value: Any) -> Any:
+    """
+    Intern a string parsed from request JSON.
+    
+    Decoded JSON strings are fresh objects; interning values that are
+    compared against the interned constants (exam names) or used as dict
+    keys many times (subjects) lets those comparisons and lookups
+    short-circuit on identity.
+    
+    Args:
+        value: Parsed value
+        
+    Returns:
+        Interned string, or the value unchanged if it is not a string
+    """
+    return sys.intern(value) if type(value) is str else value